@@ -4,6 +4,12 @@ from __future__ import annotations
 
 import math
 from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import accumulate
+from operator import sub
 from typing import NamedTuple
 
 
@@ -15,9 +21,54 @@ class CurvePoint(NamedTuple):
     angle: float  # Angle of normal in radians
 
 
+@dataclass
+class CurvePointArray:
+    """Structure-of-arrays form of a list of CurvePoints."""
+
+    x: list[float]
+    y: list[float]
+    normal_x: list[float]
+    normal_y: list[float]
+    angle: list[float]
+
+    @classmethod
+    def from_points(cls, points: Sequence[CurvePoint]) -> CurvePointArray:
+        if not points:
+            return cls([], [], [], [], [])
+        x, y, nx, ny, angle = map(list, zip(*points))
+        return cls(x, y, nx, ny, angle)
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def points(self) -> list[CurvePoint]:
+        """Materialize as a list of CurvePoints."""
+        return list(map(CurvePoint, self.x, self.y, self.normal_x, self.normal_y, self.angle))
+
+
+@lru_cache(maxsize=64)
+def _uniform_grid(num_samples: int) -> tuple[float, ...]:
+    """Evenly spaced parameters i/num_samples for i in 0..num_samples."""
+    return tuple(i / num_samples for i in range(num_samples + 1))
+
+
+def _fold_angle(angle: float) -> float:
+    """Map an angle in radians into atan2's range (-pi, pi]."""
+    angle = math.remainder(angle, 2 * math.pi)
+    return math.pi if angle == -math.pi else angle
+
+
 class ParametricCurve(ABC):
     """Abstract base class for membrane centerline curves."""
 
+    # True when arc length grows linearly in t, so t needs no table inversion
+    _constant_speed = False
+
+    def __init__(self) -> None:
+        # Curves are immutable once built, so uniform samplings can be reused
+        self._sample_cache: dict[float, CurvePointArray] = {}
+        self._grid_cache: dict[int, CurvePointArray] = {}
+
     @abstractmethod
     def point(self, t: float) -> tuple[float, float]:
         """Return (x, y) at parameter t in [0, 1]."""
@@ -35,6 +86,15 @@ class ParametricCurve(ABC):
         # Rotate tangent -90 degrees (outward = upward for left-to-right curves)
         return (-ty / length, tx / length)
 
+    def normal_angle(self, t: float) -> float:
+        """Angle of :meth:`normal` at t, in atan2's range.
+
+        Subclasses whose normal angle has a closed form override this (and
+        :meth:`sample`) to skip the atan2.
+        """
+        nx, ny = self.normal(t)
+        return math.atan2(ny, nx)
+
     def sample(self, t: float) -> CurvePoint:
         x, y = self.point(t)
         nx, ny = self.normal(t)
@@ -45,54 +105,128 @@ class ParametricCurve(ABC):
     def arc_length(self) -> float:
         """Total arc length."""
 
+    def points_array(self, ts: Sequence[float]) -> tuple[list[float], list[float]]:
+        """Return (xs, ys) for a batch of parameters.
+
+        Subclasses override this with a closed-form loop that avoids the
+        per-call method dispatch of :meth:`point`.
+        """
+        xs: list[float] = []
+        ys: list[float] = []
+        for t in ts:
+            x, y = self.point(t)
+            xs.append(x)
+            ys.append(y)
+        return xs, ys
+
+    def tangents_array(self, ts: Sequence[float]) -> tuple[list[float], list[float]]:
+        """Return tangent components (txs, tys) for a batch of parameters."""
+        txs: list[float] = []
+        tys: list[float] = []
+        for t in ts:
+            tx, ty = self.tangent(t)
+            txs.append(tx)
+            tys.append(ty)
+        return txs, tys
+
+    def normals_array(self, ts: Sequence[float]) -> tuple[list[float], list[float]]:
+        """Batch form of :meth:`normal`.
+
+        Subclasses that override ``normal`` must override this as well.
+        """
+        txs, tys = self.tangents_array(ts)
+        nxs: list[float] = []
+        nys: list[float] = []
+        hypot = math.hypot
+        for tx, ty in zip(txs, tys):
+            length = hypot(tx, ty)
+            if length < 1e-10:
+                nxs.append(0.0)
+                nys.append(-1.0)
+            else:
+                nxs.append(-ty / length)
+                nys.append(tx / length)
+        return nxs, nys
+
+    def sample_array(self, ts: Sequence[float]) -> CurvePointArray:
+        """Sample a batch of parameters."""
+        xs, ys = self.points_array(ts)
+        nxs, nys = self.normals_array(ts)
+        return CurvePointArray(xs, ys, nxs, nys, list(map(math.atan2, nys, nxs)))
+
     def sample_uniform(self, spacing: float) -> list[CurvePoint]:
         """Sample at uniform arc-length intervals."""
+        return self.sample_uniform_arrays(spacing).points()
+
+    def sample_uniform_arrays(self, spacing: float) -> CurvePointArray:
+        """Like :meth:`sample_uniform`, in structure-of-arrays form.
+
+        Results are cached per spacing; the returned columns must not be mutated.
+        """
+        key = round(spacing, 6)
+        samples = self._sample_cache.get(key)
+        if samples is None:
+            samples = self._sample_cache[key] = self._sample_uniform(spacing)
+        return samples
+
+    def sample_grid(self, n: int) -> CurvePointArray:
+        """Sample t = i/n for i in 0..n; a closed curve ends back at t = 0.
+
+        Results are cached per n; the returned columns must not be mutated.
+        """
+        samples = self._grid_cache.get(n)
+        if samples is None:
+            ts = _uniform_grid(n)
+            if self.is_closed:
+                ts = (*ts[:-1], 0.0)
+            samples = self._grid_cache[n] = self.sample_array(ts)
+        return samples
+
+    def _sample_uniform(self, spacing: float) -> CurvePointArray:
         total = self.arc_length()
         n = max(1, int(total / spacing))
+        if total < 1e-10:
+            return self.sample_array([0.5])
+        if self._constant_speed:
+            # t is proportional to arc length: sample the interval midpoints
+            return self.sample_array([(i + 0.5) / n for i in range(n)])
 
         # Build cumulative arc length table (adaptive sampling)
         num_samples = max(500, n * 10)
-        table: list[tuple[float, float]] = []  # (t, cumulative_length)
-        cum = 0.0
-        prev_x, prev_y = self.point(0.0)
-        table.append((0.0, 0.0))
+        ts = _uniform_grid(num_samples)
+        xs, ys = self.points_array(ts)
+        seg = map(math.hypot, map(sub, xs[1:], xs), map(sub, ys[1:], ys))
+        cum = list(accumulate(seg, initial=0.0))
 
-        for i in range(1, num_samples + 1):
-            t = i / num_samples
-            px, py = self.point(t)
-            cum += math.hypot(px - prev_x, py - prev_y)
-            table.append((t, cum))
-            prev_x, prev_y = px, py
-
-        total_measured = table[-1][1]
+        total_measured = cum[-1]
         if total_measured < 1e-10:
-            return [self.sample(0.5)]
+            return self.sample_array([0.5])
 
         actual_spacing = total_measured / n
-        points: list[CurvePoint] = []
-        table_idx = 0
+        last = len(cum) - 1
+        sample_ts: list[float] = []
+        idx = 0
 
         for i in range(n):
             target_s = (i + 0.5) * actual_spacing
-            # Binary search in table
-            while table_idx < len(table) - 1 and table[table_idx + 1][1] < target_s:
-                table_idx += 1
+            # First table entry at or beyond the target, minus one; targets
+            # increase, so the search resumes from the previous entry
+            idx = max(0, bisect_left(cum, target_s, idx) - 1)
 
-            if table_idx >= len(table) - 1:
+            if idx >= last:
                 t = 1.0
             else:
-                t0, s0 = table[table_idx]
-                t1, s1 = table[min(table_idx + 1, len(table) - 1)]
-                ds = s1 - s0
+                s0 = cum[idx]
+                ds = cum[idx + 1] - s0
                 if ds < 1e-10:
-                    t = t0
+                    t = ts[idx]
                 else:
                     frac = (target_s - s0) / ds
-                    t = t0 + frac * (t1 - t0)
+                    t = ts[idx] + frac * (ts[idx + 1] - ts[idx])
 
-            points.append(self.sample(t))
+            sample_ts.append(t)
 
-        return points
+        return self.sample_array(sample_ts)
 
     @property
     def is_closed(self) -> bool:
@@ -102,7 +236,10 @@ class ParametricCurve(ABC):
 class LinearCurve(ParametricCurve):
     """Straight horizontal line. Normal points upward (outer leaflet on top)."""
 
+    _constant_speed = True
+
     def __init__(self, x0: float, y0: float, length: float):
+        super().__init__()
         self.x0 = x0
         self.y0 = y0
         self.length = length
@@ -110,12 +247,26 @@ class LinearCurve(ParametricCurve):
     def point(self, t: float) -> tuple[float, float]:
         return (self.x0 + t * self.length, self.y0)
 
+    def points_array(self, ts: Sequence[float]) -> tuple[list[float], list[float]]:
+        x0, length = self.x0, self.length
+        return [x0 + t * length for t in ts], [self.y0] * len(ts)
+
     def tangent(self, t: float) -> tuple[float, float]:
         return (1.0, 0.0)
 
     def normal(self, t: float) -> tuple[float, float]:
         return (0.0, -1.0)  # Upward in SVG (outer leaflet faces up)
 
+    def normals_array(self, ts: Sequence[float]) -> tuple[list[float], list[float]]:
+        n = len(ts)
+        return [0.0] * n, [-1.0] * n
+
+    def normal_angle(self, t: float) -> float:
+        return -math.pi / 2
+
+    def sample(self, t: float) -> CurvePoint:
+        return CurvePoint(self.x0 + t * self.length, self.y0, 0.0, -1.0, -math.pi / 2)
+
     def arc_length(self) -> float:
         return self.length
 
@@ -123,7 +274,10 @@ class LinearCurve(ParametricCurve):
 class CircularCurve(ParametricCurve):
     """Circle (closed vesicle)."""
 
+    _constant_speed = True
+
     def __init__(self, cx: float, cy: float, radius: float):
+        super().__init__()
         self.cx = cx
         self.cy = cy
         self.radius = radius
@@ -135,6 +289,12 @@ class CircularCurve(ParametricCurve):
             self.cy + self.radius * math.sin(angle),
         )
 
+    def points_array(self, ts: Sequence[float]) -> tuple[list[float], list[float]]:
+        cx, cy, r = self.cx, self.cy, self.radius
+        cos, sin = math.cos, math.sin
+        angles = [2 * math.pi * t for t in ts]
+        return [cx + r * cos(a) for a in angles], [cy + r * sin(a) for a in angles]
+
     def tangent(self, t: float) -> tuple[float, float]:
         angle = 2 * math.pi * t
         return (-math.sin(angle), math.cos(angle))
@@ -144,6 +304,36 @@ class CircularCurve(ParametricCurve):
         angle = 2 * math.pi * t
         return (math.cos(angle), math.sin(angle))
 
+    def normals_array(self, ts: Sequence[float]) -> tuple[list[float], list[float]]:
+        angles = [2 * math.pi * t for t in ts]
+        return list(map(math.cos, angles)), list(map(math.sin, angles))
+
+    def normal_angle(self, t: float) -> float:
+        # The normal angle is the polar angle itself; fold it into atan2's range
+        a = 2 * math.pi * t
+        return a - 2 * math.pi if a > math.pi else a
+
+    def sample(self, t: float) -> CurvePoint:
+        a = 2 * math.pi * t
+        c = math.cos(a)
+        s = math.sin(a)
+        r = self.radius
+        return CurvePoint(self.cx + r * c, self.cy + r * s, c, s, self.normal_angle(t))
+
+    def sample_array(self, ts: Sequence[float]) -> CurvePointArray:
+        cx, cy, r = self.cx, self.cy, self.radius
+        two_pi = 2 * math.pi
+        angles = [two_pi * t for t in ts]
+        cs = list(map(math.cos, angles))
+        ss = list(map(math.sin, angles))
+        return CurvePointArray(
+            [cx + r * c for c in cs],
+            [cy + r * s for s in ss],
+            cs,
+            ss,
+            [a - two_pi if a > math.pi else a for a in angles],
+        )
+
     def arc_length(self) -> float:
         return 2 * math.pi * self.radius
 
@@ -156,10 +346,14 @@ class EllipticalCurve(ParametricCurve):
     """Ellipse (closed vesicle)."""
 
     def __init__(self, cx: float, cy: float, rx: float, ry: float):
+        super().__init__()
         self.cx = cx
         self.cy = cy
         self.rx = rx
         self.ry = ry
+        # Ramanujan approximation
+        h = ((rx - ry) / (rx + ry)) ** 2
+        self._length = math.pi * (rx + ry) * (1 + 3 * h / (10 + math.sqrt(4 - 3 * h)))
 
     def point(self, t: float) -> tuple[float, float]:
         angle = 2 * math.pi * t
@@ -168,14 +362,49 @@ class EllipticalCurve(ParametricCurve):
             self.cy + self.ry * math.sin(angle),
         )
 
+    def points_array(self, ts: Sequence[float]) -> tuple[list[float], list[float]]:
+        cx, cy, rx, ry = self.cx, self.cy, self.rx, self.ry
+        cos, sin = math.cos, math.sin
+        angles = [2 * math.pi * t for t in ts]
+        return [cx + rx * cos(a) for a in angles], [cy + ry * sin(a) for a in angles]
+
     def tangent(self, t: float) -> tuple[float, float]:
         angle = 2 * math.pi * t
         return (-self.rx * math.sin(angle), self.ry * math.cos(angle))
 
+    def tangents_array(self, ts: Sequence[float]) -> tuple[list[float], list[float]]:
+        rx, ry = self.rx, self.ry
+        cos, sin = math.cos, math.sin
+        angles = [2 * math.pi * t for t in ts]
+        return [-rx * sin(a) for a in angles], [ry * cos(a) for a in angles]
+
+    def sample_array(self, ts: Sequence[float]) -> CurvePointArray:
+        # One cos/sin pair per t serves the point, tangent and normal
+        cx, cy, rx, ry = self.cx, self.cy, self.rx, self.ry
+        hypot = math.hypot
+        xs: list[float] = []
+        ys: list[float] = []
+        nxs: list[float] = []
+        nys: list[float] = []
+        for t in ts:
+            a = 2 * math.pi * t
+            c = math.cos(a)
+            s = math.sin(a)
+            xs.append(cx + rx * c)
+            ys.append(cy + ry * s)
+            tx = -rx * s
+            ty = ry * c
+            length = hypot(tx, ty)
+            if length < 1e-10:
+                nxs.append(0.0)
+                nys.append(-1.0)
+            else:
+                nxs.append(-ty / length)
+                nys.append(tx / length)
+        return CurvePointArray(xs, ys, nxs, nys, list(map(math.atan2, nys, nxs)))
+
     def arc_length(self) -> float:
-        # Ramanujan approximation
-        h = ((self.rx - self.ry) / (self.rx + self.ry)) ** 2
-        return math.pi * (self.rx + self.ry) * (1 + 3 * h / (10 + math.sqrt(4 - 3 * h)))
+        return self._length
 
     @property
     def is_closed(self) -> bool:
@@ -189,9 +418,13 @@ class CompositeCurve(ParametricCurve):
     """
 
     def __init__(self, curves: list[ParametricCurve], flip_normals: bool = False):
+        super().__init__()
         self.curves = curves
         self._flip_normals = flip_normals
         self._lengths = [c.arc_length() for c in curves]
+        # Sub-curve t ranges are proportional to length, so a chain of
+        # constant-speed pieces is itself constant-speed
+        self._constant_speed = all(c._constant_speed for c in curves)
         self._total = sum(self._lengths)
         # Build cumulative boundaries
         self._boundaries: list[float] = []
@@ -200,29 +433,67 @@ class CompositeCurve(ParametricCurve):
             cum += length
             self._boundaries.append(cum / self._total if self._total > 0 else 0)
 
+    def _locate(self, t: float) -> tuple[int, float]:
+        """Map global t to (sub-curve index, local_t)."""
+        t = max(0.0, min(1.0, t))
+        bounds = self._boundaries
+        i = min(bisect_left(bounds, t), len(bounds) - 1)
+        prev = bounds[i - 1] if i else 0.0
+        span = bounds[i] - prev
+        if span < 1e-10:
+            return i, 0.0
+        return i, (t - prev) / span
+
     def _resolve(self, t: float) -> tuple[ParametricCurve, float]:
         """Map global t to (sub-curve, local_t)."""
-        t = max(0.0, min(1.0, t))
-        prev = 0.0
-        for i, boundary in enumerate(self._boundaries):
-            if t <= boundary or i == len(self._boundaries) - 1:
-                span = boundary - prev
-                if span < 1e-10:
-                    local_t = 0.0
-                else:
-                    local_t = (t - prev) / span
-                return self.curves[i], local_t
-            prev = boundary
-        return self.curves[-1], 1.0
+        i, local_t = self._locate(t)
+        return self.curves[i], local_t
+
+    def _group(self, ts: Sequence[float]) -> dict[int, tuple[list[int], list[float]]]:
+        """Bucket global ts by sub-curve as (positions, local ts)."""
+        groups: dict[int, tuple[list[int], list[float]]] = {}
+        for pos, t in enumerate(ts):
+            i, local_t = self._locate(t)
+            group = groups.get(i)
+            if group is None:
+                group = groups[i] = ([], [])
+            group[0].append(pos)
+            group[1].append(local_t)
+        return groups
+
+    def _evaluate_batch(
+        self,
+        ts: Sequence[float],
+        evaluate: Callable[[ParametricCurve, list[float]], tuple[list[float], list[float]]],
+        groups: dict[int, tuple[list[int], list[float]]] | None = None,
+    ) -> tuple[list[float], list[float]]:
+        """Evaluate a batch of global ts with one call per sub-curve."""
+        if groups is None:
+            groups = self._group(ts)
+        n = len(ts)
+        out_a = [0.0] * n
+        out_b = [0.0] * n
+        for i, (positions, local_ts) in groups.items():
+            vals_a, vals_b = evaluate(self.curves[i], local_ts)
+            for pos, a, b in zip(positions, vals_a, vals_b):
+                out_a[pos] = a
+                out_b[pos] = b
+        return out_a, out_b
 
     def point(self, t: float) -> tuple[float, float]:
         curve, local_t = self._resolve(t)
         return curve.point(local_t)
 
+    def points_array(self, ts: Sequence[float]) -> tuple[list[float], list[float]]:
+        return self._evaluate_batch(ts, lambda c, local_ts: c.points_array(local_ts))
+
     def tangent(self, t: float) -> tuple[float, float]:
         curve, local_t = self._resolve(t)
         return curve.tangent(local_t)
 
+    def tangents_array(self, ts: Sequence[float]) -> tuple[list[float], list[float]]:
+        return self._evaluate_batch(ts, lambda c, local_ts: c.tangents_array(local_ts))
+
     def normal(self, t: float) -> tuple[float, float]:
         curve, local_t = self._resolve(t)
         nx, ny = curve.normal(local_t)
@@ -230,6 +501,40 @@ class CompositeCurve(ParametricCurve):
             return (-nx, -ny)
         return (nx, ny)
 
+    def normals_array(self, ts: Sequence[float]) -> tuple[list[float], list[float]]:
+        return self._flip(self._evaluate_batch(ts, lambda c, local_ts: c.normals_array(local_ts)))
+
+    def _flip(self, normals: tuple[list[float], list[float]]) -> tuple[list[float], list[float]]:
+        nxs, nys = normals
+        if self._flip_normals:
+            return [-nx for nx in nxs], [-ny for ny in nys]
+        return nxs, nys
+
+    def sample_array(self, ts: Sequence[float]) -> CurvePointArray:
+        # Positions and normals share one pass locating each t's sub-curve
+        groups = self._group(ts)
+        xs, ys = self._evaluate_batch(ts, lambda c, local_ts: c.points_array(local_ts), groups)
+        nxs, nys = self._flip(
+            self._evaluate_batch(ts, lambda c, local_ts: c.normals_array(local_ts), groups)
+        )
+        return CurvePointArray(xs, ys, nxs, nys, list(map(math.atan2, nys, nxs)))
+
+    def normal_angle(self, t: float) -> float:
+        curve, local_t = self._resolve(t)
+        angle = curve.normal_angle(local_t)
+        if self._flip_normals:
+            return _fold_angle(angle + math.pi)
+        return angle
+
+    def sample(self, t: float) -> CurvePoint:
+        curve, local_t = self._resolve(t)
+        cp = curve.sample(local_t)
+        if self._flip_normals:
+            return CurvePoint(
+                cp.x, cp.y, -cp.normal_x, -cp.normal_y, _fold_angle(cp.angle + math.pi),
+            )
+        return cp
+
     def arc_length(self) -> float:
         return self._total
 
@@ -237,25 +542,39 @@ class CompositeCurve(ParametricCurve):
 class LineSegmentCurve(ParametricCurve):
     """Straight line from (x0, y0) to (x1, y1)."""
 
+    _constant_speed = True
+
     def __init__(self, x0: float, y0: float, x1: float, y1: float):
+        super().__init__()
         self.x0, self.y0 = x0, y0
         self.x1, self.y1 = x1, y1
         self._dx = x1 - x0
         self._dy = y1 - y0
+        self._length = math.hypot(self._dx, self._dy)
 
     def point(self, t: float) -> tuple[float, float]:
         return (self.x0 + t * self._dx, self.y0 + t * self._dy)
 
+    def points_array(self, ts: Sequence[float]) -> tuple[list[float], list[float]]:
+        x0, y0, dx, dy = self.x0, self.y0, self._dx, self._dy
+        return [x0 + t * dx for t in ts], [y0 + t * dy for t in ts]
+
     def tangent(self, t: float) -> tuple[float, float]:
         return (self._dx, self._dy)
 
+    def tangents_array(self, ts: Sequence[float]) -> tuple[list[float], list[float]]:
+        n = len(ts)
+        return [self._dx] * n, [self._dy] * n
+
     def arc_length(self) -> float:
-        return math.hypot(self._dx, self._dy)
+        return self._length
 
 
 class ArcCurve(ParametricCurve):
     """Circular arc from start_angle to end_angle (radians)."""
 
+    _constant_speed = True
+
     def __init__(
         self,
         cx: float, cy: float,
@@ -263,6 +582,7 @@ class ArcCurve(ParametricCurve):
         start_angle: float,
         end_angle: float,
     ):
+        super().__init__()
         self.cx = cx
         self.cy = cy
         self.radius = radius
@@ -276,11 +596,61 @@ class ArcCurve(ParametricCurve):
             self.cy + self.radius * math.sin(angle),
         )
 
+    def points_array(self, ts: Sequence[float]) -> tuple[list[float], list[float]]:
+        cx, cy, r = self.cx, self.cy, self.radius
+        cos, sin = math.cos, math.sin
+        a0 = self.start_angle
+        sweep = self.end_angle - self.start_angle
+        angles = [a0 + t * sweep for t in ts]
+        return [cx + r * cos(a) for a in angles], [cy + r * sin(a) for a in angles]
+
     def tangent(self, t: float) -> tuple[float, float]:
         angle = self.start_angle + t * (self.end_angle - self.start_angle)
         direction = 1.0 if self.end_angle > self.start_angle else -1.0
         return (-math.sin(angle) * direction, math.cos(angle) * direction)
 
+    def tangents_array(self, ts: Sequence[float]) -> tuple[list[float], list[float]]:
+        cos, sin = math.cos, math.sin
+        a0 = self.start_angle
+        sweep = self.end_angle - self.start_angle
+        direction = 1.0 if self.end_angle > self.start_angle else -1.0
+        angles = [a0 + t * sweep for t in ts]
+        return (
+            [-sin(a) * direction for a in angles],
+            [cos(a) * direction for a in angles],
+        )
+
+    def normal(self, t: float) -> tuple[float, float]:
+        # The normal is radial: outward for counter-clockwise sweeps, inward otherwise
+        angle = self.start_angle + t * (self.end_angle - self.start_angle)
+        if self.end_angle > self.start_angle:
+            return (-math.cos(angle), -math.sin(angle))
+        return (math.cos(angle), math.sin(angle))
+
+    def normals_array(self, ts: Sequence[float]) -> tuple[list[float], list[float]]:
+        a0 = self.start_angle
+        sweep = self.end_angle - self.start_angle
+        angles = [a0 + t * sweep for t in ts]
+        if sweep > 0:
+            return [-math.cos(a) for a in angles], [-math.sin(a) for a in angles]
+        return list(map(math.cos, angles)), list(map(math.sin, angles))
+
+    def normal_angle(self, t: float) -> float:
+        angle = self.start_angle + t * (self.end_angle - self.start_angle)
+        if self.end_angle > self.start_angle:
+            angle += math.pi
+        return _fold_angle(angle)
+
+    def sample(self, t: float) -> CurvePoint:
+        angle = self.start_angle + t * (self.end_angle - self.start_angle)
+        c = math.cos(angle)
+        s = math.sin(angle)
+        x = self.cx + self.radius * c
+        y = self.cy + self.radius * s
+        if self.end_angle > self.start_angle:
+            return CurvePoint(x, y, -c, -s, _fold_angle(angle + math.pi))
+        return CurvePoint(x, y, c, s, _fold_angle(angle))
+
     def arc_length(self) -> float:
         return abs(self.end_angle - self.start_angle) * self.radius
 
@@ -288,6 +658,24 @@ class ArcCurve(ParametricCurve):
 class CubicBezierSegment(ParametricCurve):
     """Single cubic Bézier segment defined by 4 control points."""
 
+    # 16-point Gauss-Legendre abscissae and weights, mapped to [0, 1]
+    _GL_NODES = (
+        0.005299532504175031, 0.0277124884633837, 0.06718439880608412,
+        0.1222977958224985, 0.19106187779867811, 0.2709916111713863,
+        0.35919822461037054, 0.4524937450811813, 0.5475062549188188,
+        0.6408017753896295, 0.7290083888286136, 0.8089381222013219,
+        0.8777022041775016, 0.9328156011939159, 0.9722875115366163,
+        0.994700467495825,
+    )
+    _GL_WEIGHTS = (
+        0.013576229705877029, 0.031126761969323888, 0.04757925584124645,
+        0.06231448562776697, 0.07479799440828841, 0.08457825969750128,
+        0.0913017075224618, 0.09472530522753424, 0.09472530522753424,
+        0.0913017075224618, 0.08457825969750128, 0.07479799440828841,
+        0.06231448562776697, 0.04757925584124645, 0.031126761969323888,
+        0.013576229705877029,
+    )
+
     def __init__(
         self,
         p0: tuple[float, float],
@@ -295,72 +683,87 @@ class CubicBezierSegment(ParametricCurve):
         p2: tuple[float, float],
         p3: tuple[float, float],
     ):
+        super().__init__()
         self.p0 = p0
         self.p1 = p1
         self.p2 = p2
         self.p3 = p3
+        # Power-basis coefficients: B(t) = P0 + t*(c1 + t*(c2 + t*c3))
+        (x0, y0), (x1, y1), (x2, y2), (x3, y3) = p0, p1, p2, p3
+        self._c1 = (3.0 * (x1 - x0), 3.0 * (y1 - y0))
+        self._c2 = (3.0 * (x2 - 2.0 * x1 + x0), 3.0 * (y2 - 2.0 * y1 + y0))
+        self._c3 = (x3 - 3.0 * x2 + 3.0 * x1 - x0, y3 - 3.0 * y2 + 3.0 * y1 - y0)
+        # Derivative: B'(t) = c1 + t*(d2 + t*d3)
+        self._d2 = (2.0 * self._c2[0], 2.0 * self._c2[1])
+        self._d3 = (3.0 * self._c3[0], 3.0 * self._c3[1])
         self._arc_len: float | None = None
 
     def point(self, t: float) -> tuple[float, float]:
-        u = 1.0 - t
-        u2 = u * u
-        t2 = t * t
-        a = u2 * u
-        b = 3.0 * u2 * t
-        c = 3.0 * u * t2
-        d = t2 * t
+        (x0, y0), (ax, ay), (bx, by), (cx, cy) = self.p0, self._c1, self._c2, self._c3
         return (
-            a * self.p0[0] + b * self.p1[0] + c * self.p2[0] + d * self.p3[0],
-            a * self.p0[1] + b * self.p1[1] + c * self.p2[1] + d * self.p3[1],
+            x0 + t * (ax + t * (bx + t * cx)),
+            y0 + t * (ay + t * (by + t * cy)),
+        )
+
+    def points_array(self, ts: Sequence[float]) -> tuple[list[float], list[float]]:
+        (x0, y0), (ax, ay), (bx, by), (cx, cy) = self.p0, self._c1, self._c2, self._c3
+        return (
+            [x0 + t * (ax + t * (bx + t * cx)) for t in ts],
+            [y0 + t * (ay + t * (by + t * cy)) for t in ts],
         )
 
     def tangent(self, t: float) -> tuple[float, float]:
-        u = 1.0 - t
-        # Derivative: 3[(1-t)²(P1-P0) + 2(1-t)t(P2-P1) + t²(P3-P2)]
-        a = 3.0 * u * u
-        b = 6.0 * u * t
-        c = 3.0 * t * t
+        (ax, ay), (bx, by), (cx, cy) = self._c1, self._d2, self._d3
+        return (
+            ax + t * (bx + t * cx),
+            ay + t * (by + t * cy),
+        )
+
+    def tangents_array(self, ts: Sequence[float]) -> tuple[list[float], list[float]]:
+        (ax, ay), (bx, by), (cx, cy) = self._c1, self._d2, self._d3
         return (
-            a * (self.p1[0] - self.p0[0]) + b * (self.p2[0] - self.p1[0]) + c * (self.p3[0] - self.p2[0]),
-            a * (self.p1[1] - self.p0[1]) + b * (self.p2[1] - self.p1[1]) + c * (self.p3[1] - self.p2[1]),
+            [ax + t * (bx + t * cx) for t in ts],
+            [ay + t * (by + t * cy) for t in ts],
         )
 
     def arc_length(self) -> float:
         if self._arc_len is not None:
             return self._arc_len
-        # Numerical integration via polyline approximation
-        n = 200
+        # Gauss-Legendre quadrature of |B'(t)|
+        (ax, ay), (bx, by), (cx, cy) = self._c1, self._d2, self._d3
         total = 0.0
-        px, py = self.p0
-        for i in range(1, n + 1):
-            t = i / n
-            x, y = self.point(t)
-            total += math.hypot(x - px, y - py)
-            px, py = x, y
+        for t, w in zip(self._GL_NODES, self._GL_WEIGHTS):
+            total += w * math.hypot(ax + t * (bx + t * cx), ay + t * (by + t * cy))
         self._arc_len = total
         return total
 
 
+def _wrap(curves: list[ParametricCurve], flip_normals: bool = False) -> ParametricCurve:
+    """Chain curves into a CompositeCurve, returning a lone unflipped curve as-is."""
+    if len(curves) == 1 and not flip_normals:
+        return curves[0]
+    return CompositeCurve(curves, flip_normals=flip_normals)
+
+
 def build_spline_curve(
     knots: list[tuple[float, float]],
-    handles: list[list[list[float] | None]] | None = None,
-) -> CompositeCurve:
+    handles: Sequence[Sequence[Sequence[float] | None]] | None = None,
+) -> ParametricCurve:
     """Build a smooth spline through the given knots using Catmull-Rom → cubic Bézier conversion.
 
     If handles are provided, they override the auto-computed Catmull-Rom control points.
     handles[i] = [handle_in, handle_out] where each is [dx, dy] offset from knot or None.
     For segment i→i+1: cp1 uses handle_out of knot i, cp2 uses handle_in of knot i+1.
 
-    Returns a CompositeCurve of CubicBezierSegment pieces.
+    Returns a CompositeCurve of CubicBezierSegment pieces, or the bare
+    LineSegmentCurve when there are only two knots.
     """
     n = len(knots)
     if n < 2:
         raise ValueError("Need at least 2 knots")
     if n == 2:
         # Just a straight line
-        return CompositeCurve([
-            LineSegmentCurve(knots[0][0], knots[0][1], knots[1][0], knots[1][1])
-        ])
+        return LineSegmentCurve(knots[0][0], knots[0][1], knots[1][0], knots[1][1])
 
     segments: list[ParametricCurve] = []
     for i in range(n - 1):
@@ -401,7 +804,7 @@ def build_spline_curve(
 
         segments.append(CubicBezierSegment(p_i, cp1, cp2, p_ip1))
 
-    return CompositeCurve(segments)
+    return _wrap(segments)
 
 
 def build_cristae_curve(
@@ -412,7 +815,7 @@ def build_cristae_curve(
     cristae_count: int,
     cristae_spacing: float,
     flat_extension: float = 100.0,
-) -> CompositeCurve:
+) -> ParametricCurve:
     """Build a composite curve for cristae membrane.
 
     Layout per crista:
@@ -425,6 +828,9 @@ def build_cristae_curve(
     x = start_x
     bend_radius = cristae_width / 2.0
     corner_r = min(40.0, cristae_width * 0.35, cristae_depth * 0.15)
+    top_y = base_y + corner_r
+    bend_y = base_y + cristae_depth
+    half_pi = math.pi / 2
 
     # Leading flat segment (shortened by corner_r so it connects to first arc)
     if flat_extension > 0:
@@ -433,46 +839,33 @@ def build_cristae_curve(
             curves.append(LineSegmentCurve(x, base_y, lead_end, base_y))
         x += flat_extension
 
-    for i in range(cristae_count):
-        left_x = x
-        right_x = x + cristae_width
-
-        # Top-left corner: smooth RIGHT → DOWN
-        # Arc center at (left_x - r, base_y + r)
-        # Goes from angle -π/2 (tangent=RIGHT) to 0 (tangent=DOWN)
-        curves.append(ArcCurve(
-            left_x - corner_r, base_y + corner_r, corner_r,
-            -math.pi / 2, 0.0,
-        ))
-
-        # Descent (left wall going down, shortened by corner_r at top)
-        curves.append(LineSegmentCurve(
-            left_x, base_y + corner_r,
-            left_x, base_y + cristae_depth,
+    # Left wall x of every crista, stepping by width + spacing
+    lefts: list[float] = []
+    if cristae_count > 0:
+        lefts = list(accumulate(
+            range(cristae_count - 1),
+            lambda left, _: left + cristae_width + cristae_spacing,
+            initial=x,
         ))
 
-        # U-bend at bottom (semicircle from left to right)
-        center_x = (left_x + right_x) / 2.0
-        bend_y = base_y + cristae_depth
-        curves.append(ArcCurve(
-            center_x, bend_y, bend_radius,
-            math.pi, 0.0,
+    for i, left_x in enumerate(lefts):
+        right_x = left_x + cristae_width
+        curves.extend((
+            # Top-left corner: smooth RIGHT → DOWN
+            # Arc center at (left_x - r, base_y + r)
+            # Goes from angle -π/2 (tangent=RIGHT) to 0 (tangent=DOWN)
+            ArcCurve(left_x - corner_r, top_y, corner_r, -half_pi, 0.0),
+            # Descent (left wall going down, shortened by corner_r at top)
+            LineSegmentCurve(left_x, top_y, left_x, bend_y),
+            # U-bend at bottom (semicircle from left to right)
+            ArcCurve((left_x + right_x) / 2.0, bend_y, bend_radius, math.pi, 0.0),
+            # Ascent (right wall going up, shortened by corner_r at top)
+            LineSegmentCurve(right_x, bend_y, right_x, top_y),
+            # Top-right corner: smooth UP → RIGHT
+            # Arc center at (right_x + r, base_y + r)
+            # Goes from angle π (tangent=UP) to 3π/2 (tangent=RIGHT)
+            ArcCurve(right_x + corner_r, top_y, corner_r, math.pi, 3 * half_pi),
         ))
-
-        # Ascent (right wall going up, shortened by corner_r at top)
-        curves.append(LineSegmentCurve(
-            right_x, base_y + cristae_depth,
-            right_x, base_y + corner_r,
-        ))
-
-        # Top-right corner: smooth UP → RIGHT
-        # Arc center at (right_x + r, base_y + r)
-        # Goes from angle π (tangent=UP) to 3π/2 (tangent=RIGHT)
-        curves.append(ArcCurve(
-            right_x + corner_r, base_y + corner_r, corner_r,
-            math.pi, 3 * math.pi / 2,
-        ))
-
         x = right_x
 
         # Spacing between cristae (flat segment, shortened by corner radii)
@@ -481,11 +874,10 @@ def build_cristae_curve(
             gap_end = x + cristae_spacing - corner_r
             if gap_end > gap_start:
                 curves.append(LineSegmentCurve(gap_start, base_y, gap_end, base_y))
-            x += cristae_spacing
 
     # Trailing flat segment
     if flat_extension > 0:
         trail_start = x + corner_r
         curves.append(LineSegmentCurve(trail_start, base_y, trail_start + flat_extension, base_y))
 
-    return CompositeCurve(curves, flip_normals=True)
+    return _wrap(curves, flip_normals=True)
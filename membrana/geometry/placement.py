@@ -4,13 +4,14 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
+from functools import lru_cache
 
 from ..models.lipids import LeafletComposition, LipidComposition, LipidType
 from ..models.membrane import MembraneConfig
-from .curves import CurvePoint, ParametricCurve
+from .curves import CurvePointArray, ParametricCurve
 
 
-@dataclass
+@dataclass(slots=True)
 class LipidInstance:
     """A placed lipid in the membrane."""
 
@@ -31,27 +32,40 @@ def distribute_types(ratios: dict[str, float], n: int) -> list[str]:
     """
     if not ratios or n <= 0:
         return []
+    # The same composition and slot count recur across renders
+    return list(_distribute_types(tuple(ratios.items()), n))
 
+
+@lru_cache(maxsize=256)
+def _distribute_types(items: tuple[tuple[str, float], ...], n: int) -> tuple[str, ...]:
     # Normalize ratios
-    total = sum(ratios.values())
+    total = sum(v for _, v in items)
     if total < 1e-10:
-        types = list(ratios.keys())
-        return [types[i % len(types)] for i in range(n)]
+        types = [k for k, _ in items]
+        return tuple(types[i % len(types)] for i in range(n))
 
-    norm = {k: v / total for k, v in ratios.items()}
+    norm = {k: v / total for k, v in items}
     types = sorted(norm.keys(), key=lambda k: -norm[k])
 
-    error = {t: 0.0 for t in types}
+    # Running error per type, indexed in `types` order. The update and the
+    # argmax are fused into one pass; ties go to the earlier (larger) type.
+    weighted = list(enumerate(norm[t] for t in types))
+    error = [0.0] * len(types)
     result: list[str] = []
 
     for _ in range(n):
-        for t in types:
-            error[t] += norm[t]
-        best = max(types, key=lambda t: error[t])
-        result.append(best)
-        error[best] -= 1.0
+        best = 0
+        best_err = -math.inf
+        for i, w in weighted:
+            e = error[i] + w
+            error[i] = e
+            if e > best_err:
+                best = i
+                best_err = e
+        result.append(types[best])
+        error[best] = best_err - 1.0
 
-    return result
+    return tuple(result)
 
 
 class LipidPlacer:
@@ -79,12 +93,29 @@ class LipidPlacer:
         offset_sign: +1 for outer leaflet (normal direction),
                     -1 for inner leaflet (anti-normal).
         """
-        half_thickness = self.config.width / 2.0 + self.config.leaflet_gap / 2.0
-        offset = offset_sign * half_thickness
+        return self._place_from_centers(self._center_points(), leaflet, offset_sign)
+
+    def place_all(self) -> list[LipidInstance]:
+        """Place lipids on both leaflets."""
+        # Both leaflets share the same centerline sampling
+        center_points = self._center_points()
+        outer = self._place_from_centers(center_points, "outer", +1.0)
+        inner = self._place_from_centers(center_points, "inner", -1.0)
+        return outer + inner
+
+    def _center_points(self) -> CurvePointArray:
+        """Sample the centerline at uniform intervals."""
         spacing = self.config.lipid_base_size + self.config.lipid_spacing
+        return self.curve.sample_uniform_arrays(spacing)
 
-        # Sample the centerline at uniform intervals
-        center_points = self.curve.sample_uniform(spacing)
+    def _place_from_centers(
+        self,
+        centers: CurvePointArray,
+        leaflet: str,
+        offset_sign: float,
+    ) -> list[LipidInstance]:
+        half_thickness = self.config.width / 2.0 + self.config.leaflet_gap / 2.0
+        offset = offset_sign * half_thickness
 
         # Get composition for this leaflet
         if leaflet == "outer":
@@ -94,42 +125,40 @@ class LipidPlacer:
         else:
             comp = self.composition.outer_leaflet
 
-        # Distribute lipid types across positions
-        type_ids = distribute_types(comp.ratios, len(center_points))
-
-        instances: list[LipidInstance] = []
-        for i, cp in enumerate(center_points):
-            # Offset along normal
-            ox = cp.x + cp.normal_x * offset
-            oy = cp.y + cp.normal_y * offset
+        n = len(centers)
 
-            # Lipid angle: tails point TOWARD membrane center
-            # Outer leaflet: tails in -normal direction (toward center)
-            # Inner leaflet: tails in +normal direction (toward center)
-            if leaflet == "outer":
-                angle = math.atan2(-cp.normal_y, -cp.normal_x)
-            else:
-                angle = math.atan2(cp.normal_y, cp.normal_x)
-
-            # Calculate t parameter (approximate from index)
-            t_param = (i + 0.5) / len(center_points) if center_points else 0.5
+        # Distribute lipid types across positions
+        items = comp.ratio_items
+        type_ids = list(_distribute_types(items, n)) if items and n > 0 else []
+        if len(type_ids) < n:
+            type_ids += [items[0][0]] * (n - len(type_ids))
+
+        # Offset along normal
+        nxs, nys = centers.normal_x, centers.normal_y
+        xs = [x + nx * offset for x, nx in zip(centers.x, nxs)]
+        ys = [y + ny * offset for y, ny in zip(centers.y, nys)]
+
+        # Lipid angle: tails point TOWARD membrane center
+        # Outer leaflet: tails in -normal direction (toward center)
+        # Inner leaflet: tails in +normal direction (toward center)
+        atan2 = math.atan2
+        if leaflet == "outer":
+            angles = [atan2(-ny, -nx) for nx, ny in zip(nxs, nys)]
+        else:
+            angles = list(map(atan2, nys, nxs))
 
-            lipid_type_id = type_ids[i] if i < len(type_ids) else list(comp.ratios.keys())[0]
+        # t parameter (approximate from index)
+        ts = [(i + 0.5) / n for i in range(n)]
 
-            instances.append(LipidInstance(
+        return [
+            LipidInstance(
                 lipid_type_id=lipid_type_id,
-                x=ox,
-                y=oy,
+                x=x,
+                y=y,
                 angle=angle,
                 scale=1.0,
                 leaflet=leaflet,
-                t=t_param,
-            ))
-
-        return instances
-
-    def place_all(self) -> list[LipidInstance]:
-        """Place lipids on both leaflets."""
-        outer = self.place_leaflet("outer", +1.0)
-        inner = self.place_leaflet("inner", -1.0)
-        return outer + inner
+                t=t,
+            )
+            for lipid_type_id, x, y, angle, t in zip(type_ids, xs, ys, angles, ts)
+        ]
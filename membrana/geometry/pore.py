@@ -19,33 +19,32 @@ def compute_toroidal_pore_lipids(
     Lipids curve from the outer leaflet through the pore to the inner leaflet,
     forming a half-torus cross-section on each side.
     """
-    points: list[CurvePoint] = []
     half_w = membrane_width / 2.0
+    pi = math.pi
+    cos, sin = math.cos, math.sin
 
-    # Left edge of pore - semicircle going from outer to inner leaflet
+    # Left edge of pore - semicircle going from outer to inner leaflet.
+    # Angle runs from top (outer leaflet) to bottom (inner leaflet), -pi/2 to +pi/2;
+    # the normal (cos, sin) points toward the pore center, so its angle is the angle itself.
     left_cx = center_x - pore_radius
     half_count = num_lipids // 2
-
-    for i in range(half_count):
-        # Angle from top (outer leaflet) to bottom (inner leaflet)
-        frac = (i + 0.5) / half_count
-        angle = -math.pi / 2 + frac * math.pi  # -pi/2 to +pi/2
-        px = left_cx + half_w * math.cos(angle)
-        py = center_y + half_w * math.sin(angle)
-        # Normal points toward pore center (inward)
-        nx = math.cos(angle)
-        ny = math.sin(angle)
-        points.append(CurvePoint(px, py, nx, ny, math.atan2(ny, nx)))
-
-    # Right edge of pore - semicircle
+    left = [-pi / 2 + (i + 0.5) / half_count * pi for i in range(half_count)]
+    points = [
+        CurvePoint(left_cx + half_w * c, center_y + half_w * s, c, s, a)
+        for a, c, s in zip(left, map(cos, left), map(sin, left))
+    ]
+
+    # Right edge of pore - semicircle from pi/2 to -pi/2 with the normal
+    # (-cos, -sin), whose angle is the angle rotated by pi into (-pi, pi]
     right_cx = center_x + pore_radius
-    for i in range(num_lipids - half_count):
-        frac = (i + 0.5) / (num_lipids - half_count)
-        angle = math.pi / 2 - frac * math.pi  # pi/2 to -pi/2
-        px = right_cx - half_w * math.cos(angle)
-        py = center_y + half_w * math.sin(angle)
-        nx = -math.cos(angle)
-        ny = -math.sin(angle)
-        points.append(CurvePoint(px, py, nx, ny, math.atan2(ny, nx)))
+    right_count = num_lipids - half_count
+    right = [pi / 2 - (i + 0.5) / right_count * pi for i in range(right_count)]
+    points.extend(
+        CurvePoint(
+            right_cx - half_w * c, center_y + half_w * s, -c, -s,
+            a - pi if a >= 0 else a + pi,
+        )
+        for a, c, s in zip(right, map(cos, right), map(sin, right))
+    )
 
     return points
@@ -4,6 +4,9 @@ from __future__ import annotations
 
 import math
 
+# The per-lipid transform: placed, rotated, unscaled
+TRANSLATE_ROTATE = "translate(%.2f,%.2f) rotate(%.2f)"
+
 
 def transform_str(
     tx: float = 0.0,
@@ -12,11 +15,15 @@ def transform_str(
     scale: float = 1.0,
 ) -> str:
     """Build an SVG transform attribute string."""
+    translated = tx != 0.0 or ty != 0.0
+    # Fast path for the per-lipid case
+    if translated and angle_deg != 0.0 and scale == 1.0:
+        return TRANSLATE_ROTATE % (tx, ty, angle_deg)
     parts: list[str] = []
-    if tx != 0.0 or ty != 0.0:
-        parts.append(f"translate({tx:.2f},{ty:.2f})")
+    if translated:
+        parts.append("translate(%.2f,%.2f)" % (tx, ty))
     if angle_deg != 0.0:
-        parts.append(f"rotate({angle_deg:.2f})")
+        parts.append("rotate(%.2f)" % angle_deg)
     if scale != 1.0:
-        parts.append(f"scale({scale:.4f})")
+        parts.append("scale(%.4f)" % scale)
     return " ".join(parts)
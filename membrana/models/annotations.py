@@ -4,10 +4,12 @@ from __future__ import annotations
 
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class CompartmentLabel(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     text: str = ""
     position: str = "top"  # "top", "bottom", "left", "right"
     font_size: float = 14.0
@@ -15,6 +17,8 @@ class CompartmentLabel(BaseModel):
 
 
 class FlipFlopArrow(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     enabled: bool = False
     position_t: float = Field(default=0.5, ge=0.0, le=1.0)
     direction: str = "outward"  # "outward" or "inward"
@@ -22,11 +26,13 @@ class FlipFlopArrow(BaseModel):
 
 
 class AnnotationConfig(BaseModel):
-    compartment_labels: list[CompartmentLabel] = Field(default_factory=list)
+    model_config = ConfigDict(frozen=True)
+
+    compartment_labels: tuple[CompartmentLabel, ...] = ()
     show_scale_bar: bool = False
     scale_bar_nm: float = 5.0
     show_thickness_markers: bool = False
-    flip_flop_arrows: list[FlipFlopArrow] = Field(default_factory=list)
+    flip_flop_arrows: tuple[FlipFlopArrow, ...] = ()
     show_leaflet_labels: bool = False
     outer_leaflet_label: str = "Outer leaflet"
     inner_leaflet_label: str = "Inner leaflet"
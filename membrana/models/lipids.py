@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Mapping
 from enum import Enum
+from functools import cached_property
+from types import MappingProxyType
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
 
 
 class LipidCategory(str, Enum):
@@ -23,37 +27,79 @@ class GeometricShape(str, Enum):
     INVERTED_CONE = "inverted_cone"
 
 
+class SpecialRendering(str, Enum):
+    CHOLESTEROL = "cholesterol"
+
+
 class LipidType(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     abbreviation: str
     category: LipidCategory = LipidCategory.GLYCEROPHOSPHOLIPID
     num_tails: int = Field(ge=1, le=4, default=2)
-    tail_lengths: list[float] = Field(default_factory=lambda: [1.0, 1.0])
+    tail_lengths: tuple[float, ...] = (1.0, 1.0)
     geometric_shape: GeometricShape = GeometricShape.CYLINDER
     head_color: str = "#4A90D9"
     tail_color: str = "#C8A84E"
     head_radius_factor: float = 1.0
     is_truncated: bool = False
-    special_rendering: Optional[str] = None
-    tail_kinks: list[list[float]] = Field(default_factory=list)
+    special_rendering: Optional[SpecialRendering] = None
+    tail_kinks: tuple[tuple[float, ...], ...] = ()
+
+    @cached_property
+    def padded_tail_lengths(self) -> tuple[float, ...]:
+        """``tail_lengths`` padded with 1.0 so every tail has an entry."""
+        missing = self.num_tails - len(self.tail_lengths)
+        return self.tail_lengths + (1.0,) * missing if missing > 0 else self.tail_lengths
+
+    @cached_property
+    def padded_tail_kinks(self) -> tuple[tuple[float, ...] | None, ...]:
+        """Kink positions per tail, None for straight tails, one entry per tail."""
+        kinks = tuple(k or None for k in self.tail_kinks)
+        missing = self.num_tails - len(kinks)
+        return kinks + (None,) * missing if missing > 0 else kinks
+
+    @field_validator("head_color", "tail_color")
+    @classmethod
+    def _intern_color(cls, value: str) -> str:
+        # A library repeats a handful of colors across dozens of types
+        return sys.intern(value)
 
 
 class LeafletComposition(BaseModel):
-    ratios: dict[str, float] = Field(default_factory=dict)
+    model_config = ConfigDict(frozen=True)
+
+    ratios: Mapping[str, float] = Field(default_factory=dict, validate_default=True)
+
+    @field_validator("ratios", mode="after")
+    @classmethod
+    def _freeze_ratios(cls, value: Mapping[str, float]) -> Mapping[str, float]:
+        # Instances are shared between requests; a read-only view keeps
+        # ratio_items in step with ratios
+        return MappingProxyType(dict(value))
+
+    @field_serializer("ratios")
+    def _dump_ratios(self, value: Mapping[str, float]) -> dict[str, float]:
+        return dict(value)
+
+    @cached_property
+    def ratio_items(self) -> tuple[tuple[str, float], ...]:
+        """``ratios`` as an interned ``(id, weight)`` tuple, built once per instance."""
+        return tuple((sys.intern(k), v) for k, v in self.ratios.items())
+
+
+# Frozen, so one instance can serve as the default for every composition
+_DEFAULT_LEAFLET = LeafletComposition(ratios={"PC": 0.5, "PE": 0.3, "cholesterol": 0.2})
 
 
 class LipidComposition(BaseModel):
-    outer_leaflet: LeafletComposition = Field(
-        default_factory=lambda: LeafletComposition(
-            ratios={"PC": 0.5, "PE": 0.3, "cholesterol": 0.2}
-        )
-    )
-    inner_leaflet: LeafletComposition = Field(
-        default_factory=lambda: LeafletComposition(
-            ratios={"PC": 0.5, "PE": 0.3, "cholesterol": 0.2}
-        )
-    )
+    model_config = ConfigDict(frozen=True)
+
+    # A factory returns the shared instance; a plain model default is deep-copied
+    outer_leaflet: LeafletComposition = Field(default_factory=lambda: _DEFAULT_LEAFLET)
+    inner_leaflet: LeafletComposition = Field(default_factory=lambda: _DEFAULT_LEAFLET)
     asymmetric: bool = False
 
 
@@ -61,7 +107,7 @@ class LipidComposition(BaseModel):
 # Default lipid type library
 # ---------------------------------------------------------------------------
 
-DEFAULT_LIPID_TYPES: list[LipidType] = [
+DEFAULT_LIPID_TYPES: tuple[LipidType, ...] = (
     # ── Glycerophospholipids (all-trans / saturated) ──
     LipidType(
         id="PC", name="Phosphatidylcholine", abbreviation="PC",
@@ -192,7 +238,7 @@ DEFAULT_LIPID_TYPES: list[LipidType] = [
         geometric_shape=GeometricShape.CONE,
         head_color="#F1C40F", tail_color="#D4AC0D",
         head_radius_factor=0.6,
-        special_rendering="cholesterol",
+        special_rendering=SpecialRendering.CHOLESTEROL,
     ),
 
     # ── Ceramide (typically saturated) ──
@@ -306,4 +352,9 @@ DEFAULT_LIPID_TYPES: list[LipidType] = [
         head_color="#5DADE2", tail_color="#C8A84E",
         is_truncated=True,
     ),
-]
+)
+
+# O(1) lookup by id into the built-in catalog
+DEFAULT_LIPID_INDEX: dict[str, LipidType] = {
+    sys.intern(lt.id): lt for lt in DEFAULT_LIPID_TYPES
+}
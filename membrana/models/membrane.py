@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class MembraneShape(str, Enum):
@@ -16,6 +16,8 @@ class MembraneShape(str, Enum):
 
 
 class MembraneConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     shape: MembraneShape = MembraneShape.LINEAR
     # Dimensions (SVG units)
     length: float = Field(default=800.0, ge=100, le=3000)
@@ -36,11 +38,11 @@ class MembraneConfig(BaseModel):
     tail_length_factor: float = Field(default=0.9, ge=0.2, le=1.0)
     leaflet_gap: float = Field(default=0.0, ge=-20, le=40)
     # Bézier
-    bezier_points: list[list[float]] = Field(
-        default_factory=lambda: [[200, 300], [450, 250], [750, 350], [1000, 300]]
+    bezier_points: tuple[tuple[float, ...], ...] = (
+        (200.0, 300.0), (450.0, 250.0), (750.0, 350.0), (1000.0, 300.0),
     )
-    bezier_handles: list[list[list[float] | None]] = Field(default_factory=list)
-    bezier_knot_modes: list[str] = Field(default_factory=list)
+    bezier_handles: tuple[tuple[tuple[float, ...] | None, ...], ...] = ()
+    bezier_knot_modes: tuple[str, ...] = ()
     # Display mode
     show_geometric_shapes: bool = False
     show_kinks: bool = True
@@ -2,54 +2,84 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class ScissorPlacement(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     position_t: float = Field(default=0.5, ge=0.0, le=1.0)
     leaflet: str = "outer"  # "outer" or "inner"
 
 
 class ScissorModeConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     enabled: bool = False
     enzyme: str = "PLA2"  # PLA1, PLA2, PLC, PLD
-    placements: list[ScissorPlacement] = Field(
-        default_factory=lambda: [ScissorPlacement(position_t=0.5)]
-    )
+    placements: tuple[ScissorPlacement, ...] = (ScissorPlacement(position_t=0.5),)
     scissor_color: str = "#FF0000"
     scissor_size: float = Field(default=20.0, ge=8, le=50)
 
 
 class PorePlacement(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     position_t: float = Field(default=0.5, ge=0.0, le=1.0)
     pore_type: str = "toroidal"  # "toroidal" or "barrel_stave"
 
 
 class PoreModeConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     enabled: bool = False
     pore_radius: float = Field(default=30.0, ge=10, le=100)
     num_lipids_in_pore: int = Field(default=8, ge=4, le=20)
-    placements: list[PorePlacement] = Field(
-        default_factory=lambda: [PorePlacement(position_t=0.5)]
-    )
-    # Kept for backward compat with saved configs (ignored by renderer)
-    pore_type: str = "toroidal"
-    position_t: float = Field(default=0.5, ge=0.0, le=1.0)
+    placements: tuple[PorePlacement, ...] = (PorePlacement(position_t=0.5),)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _migrate_legacy(cls, data: Any) -> Any:
+        # Saved configs from before multi-pore support carry a single
+        # position_t / pore_type instead of placements
+        if isinstance(data, dict) and "placements" not in data and "position_t" in data:
+            data = dict(data)
+            data["placements"] = [{
+                "position_t": data.pop("position_t"),
+                "pore_type": data.pop("pore_type", "toroidal"),
+            }]
+        return data
 
 
 class RaftPlacement(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     start_t: float = Field(default=0.3, ge=0.0, le=1.0)
     end_t: float = Field(default=0.6, ge=0.0, le=1.0)
 
 
 class RaftModeConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     enabled: bool = False
     thickness_factor: float = Field(default=1.3, ge=1.0, le=2.0)
-    placements: list[RaftPlacement] = Field(
-        default_factory=lambda: [RaftPlacement()]
-    )
-    # Kept for backward compat with saved configs (ignored by renderer)
-    start_t: float = Field(default=0.3, ge=0.0, le=1.0)
-    end_t: float = Field(default=0.6, ge=0.0, le=1.0)
+    placements: tuple[RaftPlacement, ...] = (RaftPlacement(),)
     cholesterol_enrichment: float = Field(default=0.4, ge=0.0, le=1.0)
     sm_enrichment: float = Field(default=0.3, ge=0.0, le=1.0)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _migrate_legacy(cls, data: Any) -> Any:
+        # Saved configs from before multi-raft support carry a single
+        # start_t / end_t instead of placements
+        if isinstance(data, dict) and "placements" not in data and (
+            "start_t" in data or "end_t" in data
+        ):
+            data = dict(data)
+            data["placements"] = [{
+                "start_t": data.pop("start_t", 0.3),
+                "end_t": data.pop("end_t", 0.6),
+            }]
+        return data
@@ -5,7 +5,7 @@ from __future__ import annotations
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ProteinKind(str, Enum):
@@ -19,6 +19,8 @@ class ProteinKind(str, Enum):
 
 
 class ProteinConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     kind: ProteinKind = ProteinKind.SINGLE_PASS_TM
     label: Optional[str] = None
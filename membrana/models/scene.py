@@ -2,9 +2,17 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from functools import cache
+from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    ValidatorFunctionWrapHandler,
+    field_validator,
+)
 
 from .annotations import AnnotationConfig
 from .lipids import LipidComposition, LipidType, DEFAULT_LIPID_TYPES
@@ -13,15 +21,29 @@ from .modes import PoreModeConfig, RaftModeConfig, ScissorModeConfig
 from .proteins import ProteinConfig
 
 
+# Built once; dumps a whole lipid library in a single pydantic-core call
+LIPID_TYPES_ADAPTER: TypeAdapter[tuple[LipidType, ...]] = TypeAdapter(tuple[LipidType, ...])
+
+
+@cache
+def default_lipid_types_json() -> list[dict[str, Any]]:
+    """JSON form of the built-in catalog. Shared; do not mutate."""
+    return LIPID_TYPES_ADAPTER.dump_python(DEFAULT_LIPID_TYPES, mode="json")
+
+
 class SceneConfig(BaseModel):
+    # Parsed configs are cached and shared between requests
+    model_config = ConfigDict(frozen=True)
+
     canvas_width: float = Field(default=1200.0, ge=200, le=4000)
     canvas_height: float = Field(default=600.0, ge=200, le=4000)
     background_color: Optional[str] = None
 
     membrane: MembraneConfig = Field(default_factory=MembraneConfig)
-    lipid_types: list[LipidType] = Field(default_factory=lambda: list(DEFAULT_LIPID_TYPES))
+    # The built-in catalog is shared, not copied, by every scene
+    lipid_types: tuple[LipidType, ...] = DEFAULT_LIPID_TYPES
     composition: LipidComposition = Field(default_factory=LipidComposition)
-    proteins: list[ProteinConfig] = Field(default_factory=list)
+    proteins: tuple[ProteinConfig, ...] = ()
     annotations: AnnotationConfig = Field(default_factory=AnnotationConfig)
 
     scissor_mode: ScissorModeConfig = Field(default_factory=ScissorModeConfig)
@@ -29,3 +51,14 @@ class SceneConfig(BaseModel):
     raft_mode: RaftModeConfig = Field(default_factory=RaftModeConfig)
 
     show_legend: bool = True
+
+    @field_validator("lipid_types", mode="wrap")
+    @classmethod
+    def _reuse_default_lipid_types(
+        cls, value: Any, handler: ValidatorFunctionWrapHandler,
+    ) -> tuple[LipidType, ...]:
+        # The frontend echoes the built-in catalog back with every render;
+        # recognise it and share the catalog instead of re-validating it
+        if value is DEFAULT_LIPID_TYPES or value == default_lipid_types_json():
+            return DEFAULT_LIPID_TYPES
+        return handler(value)
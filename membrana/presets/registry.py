@@ -2,21 +2,42 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+
 from ..models.annotations import AnnotationConfig, CompartmentLabel
-from ..models.lipids import DEFAULT_LIPID_TYPES, LeafletComposition, LipidComposition
+from ..models.lipids import LeafletComposition, LipidComposition
 from ..models.membrane import MembraneConfig, MembraneShape
 from ..models.scene import SceneConfig
 
 
+# Leaflets shared by both sides of a symmetric preset; frozen models, so one
+# instance serves both references
+_MITO_LEAFLET = LeafletComposition(
+    ratios={"PC": 0.35, "PE": 0.34, "CL": 0.18, "PI": 0.08, "PS": 0.05}
+)
+_BACTERIAL_LEAFLET = LeafletComposition(
+    ratios={"PE": 0.60, "PG": 0.25, "CL": 0.15}
+)
+
+
 class PresetRegistry:
     def __init__(self):
+        # Presets are built on first use and then cached
+        self._factories: dict[str, Callable[[], SceneConfig]] = {}
         self._presets: dict[str, SceneConfig] = {}
         self._register_defaults()
+        # The preset list is fixed after registration, so summarize it once
+        self._summaries: tuple[dict, ...] = tuple(
+            {"id": k, "name": k.replace("_", " ").title()}
+            for k in self._factories
+        )
 
     def _register_defaults(self):
-        self._presets["plasma_membrane"] = SceneConfig(
+        # Presets go through normal validation on purpose: pydantic-core
+        # validates these small models faster than model_construct can fill
+        # their defaults in Python.
+        self._factories["plasma_membrane"] = lambda: SceneConfig(
             membrane=MembraneConfig(shape=MembraneShape.LINEAR, length=900, width=65),
-            lipid_types=list(DEFAULT_LIPID_TYPES),
             composition=LipidComposition(
                 outer_leaflet=LeafletComposition(
                     ratios={"PC": 0.40, "SM": 0.25, "cholesterol": 0.25, "PE": 0.10}
@@ -35,20 +56,15 @@ class PresetRegistry:
             ),
         )
 
-        self._presets["mito_imm"] = SceneConfig(
+        self._factories["mito_imm"] = lambda: SceneConfig(
             membrane=MembraneConfig(
                 shape=MembraneShape.CRISTAE,
                 cristae_width=80, cristae_depth=200, cristae_count=2, cristae_spacing=100,
                 width=55, lipid_base_size=10,
             ),
-            lipid_types=list(DEFAULT_LIPID_TYPES),
             composition=LipidComposition(
-                outer_leaflet=LeafletComposition(
-                    ratios={"PC": 0.35, "PE": 0.34, "CL": 0.18, "PI": 0.08, "PS": 0.05}
-                ),
-                inner_leaflet=LeafletComposition(
-                    ratios={"PC": 0.35, "PE": 0.34, "CL": 0.18, "PI": 0.08, "PS": 0.05}
-                ),
+                outer_leaflet=_MITO_LEAFLET,
+                inner_leaflet=_MITO_LEAFLET,
             ),
             annotations=AnnotationConfig(
                 compartment_labels=[
@@ -58,10 +74,9 @@ class PresetRegistry:
             ),
         )
 
-        self._presets["vesicle"] = SceneConfig(
+        self._factories["vesicle"] = lambda: SceneConfig(
             membrane=MembraneConfig(shape=MembraneShape.CIRCULAR, radius=150, width=50,
                                     lipid_base_size=10),
-            lipid_types=list(DEFAULT_LIPID_TYPES),
             composition=LipidComposition(
                 outer_leaflet=LeafletComposition(
                     ratios={"PC": 0.50, "PE": 0.25, "cholesterol": 0.15, "SM": 0.10}
@@ -69,16 +84,11 @@ class PresetRegistry:
             ),
         )
 
-        self._presets["bacterial_om"] = SceneConfig(
+        self._factories["bacterial_om"] = lambda: SceneConfig(
             membrane=MembraneConfig(shape=MembraneShape.LINEAR, length=800, width=60),
-            lipid_types=list(DEFAULT_LIPID_TYPES),
             composition=LipidComposition(
-                outer_leaflet=LeafletComposition(
-                    ratios={"PE": 0.60, "PG": 0.25, "CL": 0.15}
-                ),
-                inner_leaflet=LeafletComposition(
-                    ratios={"PE": 0.60, "PG": 0.25, "CL": 0.15}
-                ),
+                outer_leaflet=_BACTERIAL_LEAFLET,
+                inner_leaflet=_BACTERIAL_LEAFLET,
             ),
             annotations=AnnotationConfig(
                 compartment_labels=[
@@ -88,11 +98,10 @@ class PresetRegistry:
             ),
         )
 
-        self._presets["thylakoid"] = SceneConfig(
+        self._factories["thylakoid"] = lambda: SceneConfig(
             membrane=MembraneConfig(shape=MembraneShape.ELLIPTICAL,
                                     ellipse_rx=250, ellipse_ry=120, width=50,
                                     lipid_base_size=10),
-            lipid_types=list(DEFAULT_LIPID_TYPES),
             composition=LipidComposition(
                 outer_leaflet=LeafletComposition(
                     ratios={"MGDG": 0.50, "DGDG": 0.25, "SQDG": 0.10, "PG": 0.15}
@@ -106,9 +115,8 @@ class PresetRegistry:
             ),
         )
 
-        self._presets["er_membrane"] = SceneConfig(
+        self._factories["er_membrane"] = lambda: SceneConfig(
             membrane=MembraneConfig(shape=MembraneShape.LINEAR, length=800, width=55),
-            lipid_types=list(DEFAULT_LIPID_TYPES),
             composition=LipidComposition(
                 outer_leaflet=LeafletComposition(
                     ratios={"PC": 0.55, "PE": 0.25, "PI": 0.10, "PS": 0.05, "cholesterol": 0.05}
@@ -123,9 +131,8 @@ class PresetRegistry:
         )
 
         # Custom: blank starting point for user to build anything
-        self._presets["custom"] = SceneConfig(
+        self._factories["custom"] = lambda: SceneConfig(
             membrane=MembraneConfig(shape=MembraneShape.LINEAR, length=800, width=60),
-            lipid_types=list(DEFAULT_LIPID_TYPES),
             composition=LipidComposition(
                 outer_leaflet=LeafletComposition(
                     ratios={"PC": 1.0}
@@ -134,10 +141,13 @@ class PresetRegistry:
         )
 
     def get(self, preset_id: str) -> SceneConfig | None:
-        return self._presets.get(preset_id)
+        config = self._presets.get(preset_id)
+        if config is None:
+            factory = self._factories.get(preset_id)
+            if factory is None:
+                return None
+            config = self._presets[preset_id] = factory()
+        return config
 
-    def list_summaries(self) -> list[dict]:
-        return [
-            {"id": k, "name": k.replace("_", " ").title()}
-            for k in self._presets
-        ]
+    def list_summaries(self) -> tuple[dict, ...]:
+        return self._summaries
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import math
+from collections.abc import Callable
+from functools import lru_cache
 
 from ..geometry.curves import ParametricCurve
 from ..models.annotations import AnnotationConfig
@@ -21,6 +23,20 @@ from .svg_builder import (
 )
 
 
+def _anchor_right(w: float, h: float) -> tuple[float, float]:
+    return w - 20, h / 2
+
+
+# Compartment label anchor per position, as a function of canvas size;
+# unknown positions fall back to the right edge
+_LABEL_ANCHORS: dict[str, Callable[[float, float], tuple[float, float]]] = {
+    "top": lambda w, h: (w / 2, 25),
+    "bottom": lambda w, h: (w / 2, h - 15),
+    "left": lambda w, h: (20, h / 2),
+    "right": _anchor_right,
+}
+
+
 def render_annotations(
     config: AnnotationConfig,
     curve: ParametricCurve,
@@ -29,20 +45,24 @@ def render_annotations(
     canvas_height: float,
 ) -> str:
     """Render all annotations."""
+    # Plain previews usually have every annotation layer off
+    if not (
+        config.compartment_labels
+        or config.show_leaflet_labels
+        or config.show_scale_bar
+        or config.show_thickness_markers
+        or config.flip_flop_arrows
+    ):
+        return ""
+
     elements: list[str] = []
 
     # Compartment labels
     for label in config.compartment_labels:
         if not label.text:
             continue
-        if label.position == "top":
-            x, y = canvas_width / 2, 25
-        elif label.position == "bottom":
-            x, y = canvas_width / 2, canvas_height - 15
-        elif label.position == "left":
-            x, y = 20, canvas_height / 2
-        else:
-            x, y = canvas_width - 20, canvas_height / 2
+        place = _LABEL_ANCHORS.get(label.position, _anchor_right)
+        x, y = place(canvas_width, canvas_height)
 
         elements.append(svg_text(
             label.text, x, y,
@@ -140,8 +160,12 @@ def render_legend(
     composition: LipidComposition,
     x: float,
     y: float,
+    decorations: bool = True,
 ) -> str:
-    """Render color-coded legend for active lipid types."""
+    """Render color-coded legend for active lipid types.
+
+    With *decorations* off the background box is left out.
+    """
     # Collect active types from composition
     active_ids: set[str] = set()
     for lid, ratio in composition.outer_leaflet.ratios.items():
@@ -152,7 +176,9 @@ def render_legend(
             if ratio > 0:
                 active_ids.add(lid)
 
-    if not active_ids:
+    # Resolve once; ids missing from the library get no row
+    active = [lipid_types[lid] for lid in sorted(active_ids) if lid in lipid_types]
+    if not active:
         return ""
 
     elements: list[str] = []
@@ -161,19 +187,17 @@ def render_legend(
     line_h = ss + 6
 
     # Background box
-    n = len(active_ids)
-    box_w = 130
-    box_h = n * line_h + pad * 2
-    elements.append(svg_rect(
-        x, y, box_w, box_h,
-        fill="white", stroke="#ccc", stroke_width=0.5,
-        rx=4, fill_opacity=0.9,
-    ))
+    if decorations:
+        n = len(active)
+        box_w = 130
+        box_h = n * line_h + pad * 2
+        elements.append(svg_rect(
+            x, y, box_w, box_h,
+            fill="white", stroke="#ccc", stroke_width=0.5,
+            rx=4, fill_opacity=0.9,
+        ))
 
-    for i, lid in enumerate(sorted(active_ids)):
-        lt = lipid_types.get(lid)
-        if not lt:
-            continue
+    for i, lt in enumerate(active):
         row_y = y + pad + i * line_h
 
         # Color swatch
@@ -201,6 +225,13 @@ def render_scissor_icon(x: float, y: float, angle_deg: float, color: str,
     The blades point in the +x direction (right at angle=0).
     The scene renderer rotates so blades face toward the membrane.
     """
+    inner = _scissor_body(size, color, enzyme)
+    return f'<g transform="translate({_fmt(x)},{_fmt(y)}) rotate({_fmt(angle_deg)})">{inner}</g>'
+
+
+@lru_cache(maxsize=128)
+def _scissor_body(size: float, color: str, enzyme: str) -> str:
+    """Icon geometry at the origin; shared by every placement with the same look."""
     s = size / 2
     ring_r = s * 0.24
     elements = [
@@ -236,5 +267,4 @@ def render_scissor_icon(x: float, y: float, angle_deg: float, color: str,
         text_anchor="middle", fill=color,
         font_weight="bold",
     ))
-    inner = svg_group(elements, **{"class": "scissor-icon"})
-    return f'<g transform="translate({_fmt(x)},{_fmt(y)}) rotate({_fmt(angle_deg)})">{inner}</g>'
+    return svg_group(elements, **{"class": "scissor-icon"})
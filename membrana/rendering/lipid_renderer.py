@@ -9,10 +9,61 @@ The caller wraps in a <g transform="..."> for positioning and rotation.
 from __future__ import annotations
 
 import math
+from collections.abc import Callable, Sequence
+from functools import lru_cache
 
-from ..models.lipids import GeometricShape, LipidType
+from ..models.lipids import GeometricShape, LipidType, SpecialRendering
 from . import styles
-from .svg_builder import _fmt, svg_circle, svg_group, svg_path, svg_polygon, svg_rect
+from .svg_builder import (
+    _fmt,
+    svg_circle,
+    svg_group,
+    svg_line,
+    svg_path,
+    svg_polygon,
+    svg_rect,
+)
+
+
+def _append_waves(
+    parts: list[str],
+    x: float,
+    y: float,
+    seg_len: float,
+    amplitude: float,
+    count: int,
+) -> float:
+    """Append *count* alternating cubic waves along x to *parts*; return the end y."""
+    # Control points swing between the same two x values, so format them once
+    sx = _fmt(x)
+    swing = (_fmt(x + amplitude), _fmt(x - amplitude))
+    for s in range(count):
+        near, far = swing if s % 2 == 0 else swing[::-1]
+        end_y = y + seg_len
+        parts.append(
+            f" C {near} {_fmt(y + seg_len * 0.33)},"
+            f" {far} {_fmt(y + seg_len * 0.66)},"
+            f" {sx} {_fmt(end_y)}"
+        )
+        y = end_y
+    return y
+
+
+# Stand-in for padded_tail_kinks when kinks are hidden (at most four tails)
+_NO_KINKS: tuple[None, ...] = (None,) * 4
+
+
+@lru_cache(maxsize=16)
+def _kink_directions(count: int) -> tuple[tuple[float, float], ...]:
+    """(sin, cos) of the chain direction after each of *count* cis kinks."""
+    # Each cis bond bends the chain direction by ~30°
+    bend = math.radians(30)
+    directions = []
+    angle = 0.0
+    for _ in range(count):
+        angle += bend
+        directions.append((math.sin(angle), math.cos(angle)))
+    return tuple(directions)
 
 
 def _wavy_tail_d(
@@ -21,7 +72,7 @@ def _wavy_tail_d(
     length: float,
     amplitude: float,
     segments: int = 3,
-    kinks: list[float] | None = None,
+    kinks: Sequence[float] | None = None,
 ) -> str:
     """SVG path `d` for a wavy acyl chain (cubic Bezier waves).
 
@@ -31,22 +82,9 @@ def _wavy_tail_d(
     if not kinks:
         # Fast path: no kinks
         seg_len = length / segments
-        d = f"M {_fmt(start_x)} {_fmt(start_y)}"
-        y = start_y
-        for s in range(segments):
-            direction = 1.0 if s % 2 == 0 else -1.0
-            cy1 = y + seg_len * 0.33
-            cy2 = y + seg_len * 0.66
-            end_y = y + seg_len
-            cx1 = start_x + direction * amplitude
-            cx2 = start_x - direction * amplitude
-            d += (
-                f" C {_fmt(cx1)} {_fmt(cy1)},"
-                f" {_fmt(cx2)} {_fmt(cy2)},"
-                f" {_fmt(start_x)} {_fmt(end_y)}"
-            )
-            y = end_y
-        return d
+        parts = [f"M {_fmt(start_x)} {_fmt(start_y)}"]
+        _append_waves(parts, start_x, start_y, seg_len, amplitude, segments)
+        return "".join(parts)
 
     # Kinked path: wavy section up to the first kink, then straight
     # angled segments after each cis bond (textbook representation).
@@ -54,9 +92,6 @@ def _wavy_tail_d(
     if not sorted_kinks:
         return _wavy_tail_d(start_x, start_y, length, amplitude, segments)
 
-    # Each cis bond bends the chain direction by ~30°
-    bend = math.radians(30)
-
     # Build segment boundaries from kink positions
     boundaries = [0.0] + sorted_kinks + [1.0]
 
@@ -65,51 +100,83 @@ def _wavy_tail_d(
     n_wave_segs = max(1, round(segments * (boundaries[1] - boundaries[0])))
     seg_len = first_len / n_wave_segs
 
-    d = f"M {_fmt(start_x)} {_fmt(start_y)}"
-    y = start_y
-    for s in range(n_wave_segs):
-        direction = 1.0 if s % 2 == 0 else -1.0
-        cy1 = y + seg_len * 0.33
-        cy2 = y + seg_len * 0.66
-        end_y = y + seg_len
-        cx1 = start_x + direction * amplitude
-        cx2 = start_x - direction * amplitude
-        d += (
-            f" C {_fmt(cx1)} {_fmt(cy1)},"
-            f" {_fmt(cx2)} {_fmt(cy2)},"
-            f" {_fmt(start_x)} {_fmt(end_y)}"
-        )
-        y = end_y
+    parts = [f"M {_fmt(start_x)} {_fmt(start_y)}"]
+    y = _append_waves(parts, start_x, start_y, seg_len, amplitude, n_wave_segs)
 
     # Remaining sections: straight lines at bent angles
     x = start_x
-    angle = 0.0
-    for i in range(1, len(boundaries) - 1):
-        angle += bend
+    for i, (sin_a, cos_a) in enumerate(_kink_directions(len(sorted_kinks)), start=1):
         seg_len_i = (boundaries[i + 1] - boundaries[i]) * length
-        dx = seg_len_i * math.sin(angle)
-        dy = seg_len_i * math.cos(angle)
-        x += dx
-        y += dy
-        d += f" L {_fmt(x)} {_fmt(y)}"
+        x += seg_len_i * sin_a
+        y += seg_len_i * cos_a
+        parts.append(f" L {_fmt(x)} {_fmt(y)}")
 
-    return d
+    return "".join(parts)
 
 
-def render_schematic(
+def _schematic_cholesterol(
     lipid_type: LipidType,
-    base_size: float = 12.0,
-    membrane_half_width: float = 30.0,
-    show_kinks: bool = True,
-    show_head_stroke: bool = True,
+    base_size: float,
+    membrane_half_width: float,
+    show_kinks: bool,
+    show_head_stroke: bool,
 ) -> str:
-    """Schematic mode: circle headgroup + wavy tails.
+    """Cholesterol: short tail, rigid ring structure, OH head on top."""
+    scale = base_size / 12.0
+    elements: list[str] = []
 
-    (0, 0) = leaflet surface position.
-    Head center is at (0, -head_r) so the head sits outside the membrane.
-    Tails start at (0, 0) and extend in +y toward the membrane center.
-    Heads are drawn last so they appear in front of tails.
-    """
+    head_r = 4.5 * scale * lipid_type.head_radius_factor
+    head_stroke = "#333" if show_head_stroke else "none"
+    head_sw = styles.LIPID_STROKE_WIDTH if show_head_stroke else 0
+
+    ring_w = 5.0 * scale
+    ring_h = membrane_half_width * 0.5
+
+    # 1. Short flexible tail (behind everything)
+    tail_start = ring_h
+    remaining = membrane_half_width - ring_h
+    tail_len = remaining * (lipid_type.tail_lengths[0] if lipid_type.tail_lengths else 0.6)
+    if tail_len > 2:
+        d = _wavy_tail_d(0, tail_start, tail_len, 1.5 * scale, segments=2)
+        elements.append(svg_path(
+            d,
+            fill="none",
+            stroke=lipid_type.tail_color,
+            stroke_width=styles.LIPID_TAIL_STROKE_WIDTH * scale,
+            stroke_linecap="round",
+        ))
+
+    # 2. Rigid ring structure (middle)
+    elements.append(svg_rect(
+        -ring_w / 2, 0,
+        ring_w, ring_h,
+        fill=lipid_type.tail_color,
+        stroke="#555",
+        stroke_width=styles.LIPID_STROKE_WIDTH,
+        rx=1.5 * scale,
+    ))
+
+    # 3. OH circle head (in front)
+    oh_r = head_r * 0.6
+    elements.append(svg_circle(
+        0, -oh_r, oh_r,
+        fill=lipid_type.head_color,
+        stroke=head_stroke,
+        stroke_width=head_sw,
+    ))
+
+    class_name = f"lipid lipid-{lipid_type.id}"
+    return svg_group(elements, **{"class": class_name})
+
+
+def _schematic_phospholipid(
+    lipid_type: LipidType,
+    base_size: float,
+    membrane_half_width: float,
+    show_kinks: bool,
+    show_head_stroke: bool,
+) -> str:
+    """Phospholipid: one to four wavy tails, head(s) drawn on top."""
     scale = base_size / 12.0
     elements: list[str] = []
 
@@ -120,176 +187,141 @@ def render_schematic(
     head_stroke = "#333" if show_head_stroke else "none"
     head_sw = styles.LIPID_STROKE_WIDTH if show_head_stroke else 0
 
-    if lipid_type.special_rendering == "cholesterol":
-        # Cholesterol: short tail first, then ring structure, then OH circle on top
-        ring_w = 5.0 * scale
-        ring_h = membrane_half_width * 0.5
-
-        # 1. Short flexible tail (behind everything)
-        tail_start = ring_h
-        remaining = membrane_half_width - ring_h
-        tail_len = remaining * (lipid_type.tail_lengths[0] if lipid_type.tail_lengths else 0.6)
-        if tail_len > 2:
-            d = _wavy_tail_d(0, tail_start, tail_len, 1.5 * scale, segments=2)
-            elements.append(svg_path(
-                d,
-                fill="none",
-                stroke=lipid_type.tail_color,
-                stroke_width=styles.LIPID_TAIL_STROKE_WIDTH * scale,
-                stroke_linecap="round",
-            ))
+    # Tails first, then head on top
+    # Tails start at (0, 0) = leaflet surface, extend toward membrane center
+    num_tails = lipid_type.num_tails
+    tail_base_len = membrane_half_width  # Fill the full half-width
+    wave_amp = 2.2 * scale
 
-        # 2. Rigid ring structure (middle)
-        elements.append(svg_rect(
-            -ring_w / 2, 0,
-            ring_w, ring_h,
-            fill=lipid_type.tail_color,
-            stroke="#555",
-            stroke_width=styles.LIPID_STROKE_WIDTH,
-            rx=1.5 * scale,
+    tail_lengths = lipid_type.padded_tail_lengths
+    tail_kinks = lipid_type.padded_tail_kinks if show_kinks else _NO_KINKS
+
+    offsets, amp_factor = _TAIL_LAYOUTS[min(num_tails, 4)]
+    amp = wave_amp * amp_factor
+    for tx, tl, kinks in zip(offsets(scale), tail_lengths, tail_kinks):
+        d = _wavy_tail_d(tx, 0, tail_base_len * tl, amp, kinks=kinks)
+        elements.append(svg_path(
+            d,
+            fill="none",
+            stroke=lipid_type.tail_color,
+            stroke_width=styles.LIPID_TAIL_STROKE_WIDTH * scale,
+            stroke_linecap="round",
         ))
 
-        # 3. OH circle head (in front)
-        oh_r = head_r * 0.6
+    if num_tails < 4:
+        # Head on top
         elements.append(svg_circle(
-            0, -oh_r, oh_r,
+            0, head_cy, head_r,
             fill=lipid_type.head_color,
             stroke=head_stroke,
             stroke_width=head_sw,
         ))
     else:
-        # Standard phospholipid: tails first, then head on top
-
-        # Tails start at (0, 0) = leaflet surface, extend toward membrane center
-        num_tails = lipid_type.num_tails
-        tail_base_len = membrane_half_width  # Fill the full half-width
-        wave_amp = 2.2 * scale
-
-        def _tail_kinks(i: int) -> list[float] | None:
-            if not show_kinks or not lipid_type.tail_kinks:
-                return None
-            if i < len(lipid_type.tail_kinks) and lipid_type.tail_kinks[i]:
-                return lipid_type.tail_kinks[i]
-            return None
-
-        if num_tails == 1:
-            tl = lipid_type.tail_lengths[0] if lipid_type.tail_lengths else 1.0
-            tail_len = tail_base_len * tl
-            d = _wavy_tail_d(0, 0, tail_len, wave_amp, kinks=_tail_kinks(0))
-            elements.append(svg_path(
-                d,
-                fill="none",
-                stroke=lipid_type.tail_color,
-                stroke_width=styles.LIPID_TAIL_STROKE_WIDTH * scale,
-                stroke_linecap="round",
-            ))
-            # Head on top
-            elements.append(svg_circle(
-                0, head_cy, head_r,
-                fill=lipid_type.head_color,
-                stroke=head_stroke,
-                stroke_width=head_sw,
-            ))
-        elif num_tails == 2:
-            gap = 3.0 * scale
-            for i, tx in enumerate([-gap / 2, gap / 2]):
-                tl = lipid_type.tail_lengths[i] if i < len(lipid_type.tail_lengths) else 1.0
-                tail_len = tail_base_len * tl
-                d = _wavy_tail_d(tx, 0, tail_len, wave_amp, kinks=_tail_kinks(i))
-                elements.append(svg_path(
-                    d,
-                    fill="none",
-                    stroke=lipid_type.tail_color,
-                    stroke_width=styles.LIPID_TAIL_STROKE_WIDTH * scale,
-                    stroke_linecap="round",
-                ))
-            # Head on top
-            elements.append(svg_circle(
-                0, head_cy, head_r,
-                fill=lipid_type.head_color,
-                stroke=head_stroke,
-                stroke_width=head_sw,
-            ))
-        elif num_tails == 3:
-            gap = 2.8 * scale
-            positions = [-gap, 0, gap]
-            for i, tx in enumerate(positions):
-                tl = lipid_type.tail_lengths[i] if i < len(lipid_type.tail_lengths) else 1.0
-                tail_len = tail_base_len * tl
-                d = _wavy_tail_d(tx, 0, tail_len, wave_amp * 0.8, kinks=_tail_kinks(i))
-                elements.append(svg_path(
-                    d,
-                    fill="none",
-                    stroke=lipid_type.tail_color,
-                    stroke_width=styles.LIPID_TAIL_STROKE_WIDTH * scale,
-                    stroke_linecap="round",
-                ))
-            # Head on top
-            elements.append(svg_circle(
-                0, head_cy, head_r,
-                fill=lipid_type.head_color,
-                stroke=head_stroke,
-                stroke_width=head_sw,
-            ))
-        elif num_tails >= 4:
-            # Cardiolipin: two phosphatidic acid moieties linked by glycerol
-            head_gap = 6.0 * scale
-
-            # 1. Tails first (behind heads)
-            tail_gap = 2.2 * scale
-            positions = [
-                -head_gap / 2 - tail_gap / 2,
-                -head_gap / 2 + tail_gap / 2,
-                head_gap / 2 - tail_gap / 2,
-                head_gap / 2 + tail_gap / 2,
-            ]
-            for i, tx in enumerate(positions):
-                tl = lipid_type.tail_lengths[i] if i < len(lipid_type.tail_lengths) else 1.0
-                tail_len = tail_base_len * tl
-                d = _wavy_tail_d(tx, 0, tail_len, wave_amp * 0.6, kinks=_tail_kinks(i))
-                elements.append(svg_path(
-                    d,
-                    fill="none",
-                    stroke=lipid_type.tail_color,
-                    stroke_width=styles.LIPID_TAIL_STROKE_WIDTH * scale,
-                    stroke_linecap="round",
-                ))
-
-            # 2. Two PA headgroups (in front)
-            hr = head_r * 0.75
-            elements.append(svg_circle(
-                -head_gap / 2, head_cy, hr,
-                fill=lipid_type.head_color,
-                stroke=head_stroke,
-                stroke_width=head_sw,
-            ))
-            elements.append(svg_circle(
-                head_gap / 2, head_cy, hr,
-                fill=lipid_type.head_color,
-                stroke=head_stroke,
-                stroke_width=head_sw,
-            ))
-            # Bridging glycerol backbone (line between heads)
-            bridge_y = head_cy
-            from .svg_builder import svg_line
-            elements.append(svg_line(
-                -head_gap / 2 + hr, bridge_y,
-                head_gap / 2 - hr, bridge_y,
-                stroke="#333",
-                stroke_width=styles.LIPID_STROKE_WIDTH * 1.2,
-            ))
-            # Central phosphate dot
-            elements.append(svg_circle(
-                0, bridge_y, head_r * 0.3,
-                fill="#CC5555",
-                stroke="#333",
-                stroke_width=styles.LIPID_STROKE_WIDTH * 0.8,
-            ))
+        # Cardiolipin: two phosphatidic acid moieties linked by glycerol
+        head_gap = 6.0 * scale
+
+        # Two PA headgroups (in front)
+        hr = head_r * 0.75
+        elements.append(svg_circle(
+            -head_gap / 2, head_cy, hr,
+            fill=lipid_type.head_color,
+            stroke=head_stroke,
+            stroke_width=head_sw,
+        ))
+        elements.append(svg_circle(
+            head_gap / 2, head_cy, hr,
+            fill=lipid_type.head_color,
+            stroke=head_stroke,
+            stroke_width=head_sw,
+        ))
+        # Bridging glycerol backbone (line between heads)
+        bridge_y = head_cy
+        elements.append(svg_line(
+            -head_gap / 2 + hr, bridge_y,
+            head_gap / 2 - hr, bridge_y,
+            stroke="#333",
+            stroke_width=styles.LIPID_STROKE_WIDTH * 1.2,
+        ))
+        # Central phosphate dot
+        elements.append(svg_circle(
+            0, bridge_y, head_r * 0.3,
+            fill="#CC5555",
+            stroke="#333",
+            stroke_width=styles.LIPID_STROKE_WIDTH * 0.8,
+        ))
 
     class_name = f"lipid lipid-{lipid_type.id}"
     return svg_group(elements, **{"class": class_name})
 
 
+def _cardiolipin_offsets(scale: float) -> tuple[float, ...]:
+    # Two tail pairs, one under each PA headgroup
+    head_half = 6.0 * scale / 2
+    tail_half = 2.2 * scale / 2
+    return (
+        -head_half - tail_half,
+        -head_half + tail_half,
+        head_half - tail_half,
+        head_half + tail_half,
+    )
+
+
+# Schematic tail layout per tail count: (x offsets for a scale, wave amplitude factor)
+_TAIL_LAYOUTS: dict[int, tuple[Callable[[float], tuple[float, ...]], float]] = {
+    1: (lambda scale: (0.0,), 1.0),
+    2: (lambda scale: (-3.0 * scale / 2, 3.0 * scale / 2), 1.0),
+    3: (lambda scale: (-2.8 * scale, 0.0, 2.8 * scale), 0.8),
+    4: (_cardiolipin_offsets, 0.6),
+}
+
+
+# Schematic renderer per special_rendering tag, resolved with one lookup
+_SCHEMATIC_RENDERERS: dict[SpecialRendering | None, Callable[..., str]] = {
+    SpecialRendering.CHOLESTEROL: _schematic_cholesterol,
+}
+
+
+def render_schematic(
+    lipid_type: LipidType,
+    base_size: float = 12.0,
+    membrane_half_width: float = 30.0,
+    show_kinks: bool = True,
+    show_head_stroke: bool = True,
+) -> str:
+    """Schematic mode: circle headgroup + wavy tails.
+
+    (0, 0) = leaflet surface position.
+    Head center is at (0, -head_r) so the head sits outside the membrane.
+    Tails start at (0, 0) and extend in +y toward the membrane center.
+    Heads are drawn last so they appear in front of tails.
+    """
+    render = _SCHEMATIC_RENDERERS.get(lipid_type.special_rendering, _schematic_phospholipid)
+    return render(lipid_type, base_size, membrane_half_width, show_kinks, show_head_stroke)
+
+
+# (head, tail) outline widths at base size 12, per geometric shape
+_SHAPE_WIDTHS: dict[GeometricShape, tuple[float, float]] = {
+    GeometricShape.CYLINDER: (10.0, 10.0),
+    GeometricShape.CONE: (6.0, 14.0),
+    GeometricShape.INVERTED_CONE: (14.0, 6.0),
+}
+
+
+@lru_cache(maxsize=256)
+def _geo_outline_points(
+    head_w: float, tail_w: float, head_r: float, membrane_half_width: float,
+) -> str:
+    """Trapezoid outline ``points``: from head top to tail bottom."""
+    top_y = _fmt(-head_r - head_r)
+    bottom_y = _fmt(membrane_half_width)
+    return (
+        f"{_fmt(-head_w / 2)},{top_y} "
+        f"{_fmt(head_w / 2)},{top_y} "
+        f"{_fmt(tail_w / 2)},{bottom_y} "
+        f"{_fmt(-tail_w / 2)},{bottom_y}"
+    )
+
+
 def render_geometric(
     lipid_type: LipidType,
     base_size: float = 12.0,
@@ -303,30 +335,15 @@ def render_geometric(
     scale = base_size / 12.0
     elements: list[str] = []
 
-    total_h = membrane_half_width + 4.5 * scale * lipid_type.head_radius_factor
-    head_w = 10.0 * scale
-    tail_w = 10.0 * scale
-
-    shape = lipid_type.geometric_shape
-    if shape == GeometricShape.CONE:
-        head_w = 6.0 * scale
-        tail_w = 14.0 * scale
-    elif shape == GeometricShape.INVERTED_CONE:
-        head_w = 14.0 * scale
-        tail_w = 6.0 * scale
+    head_f, tail_f = _SHAPE_WIDTHS.get(lipid_type.geometric_shape, (10.0, 10.0))
+    head_w = head_f * scale
+    tail_w = tail_f * scale
 
     head_r = 4.5 * scale * lipid_type.head_radius_factor
     head_cy = -head_r
 
-    # Trapezoid outline: from head top to tail bottom
-    pts = (
-        f"{_fmt(-head_w / 2)},{_fmt(head_cy - head_r)} "
-        f"{_fmt(head_w / 2)},{_fmt(head_cy - head_r)} "
-        f"{_fmt(tail_w / 2)},{_fmt(membrane_half_width)} "
-        f"{_fmt(-tail_w / 2)},{_fmt(membrane_half_width)}"
-    )
     elements.append(svg_polygon(
-        pts,
+        _geo_outline_points(head_w, tail_w, head_r, membrane_half_width),
         fill=lipid_type.head_color,
         fill_opacity=styles.GEO_FILL_OPACITY,
         stroke=styles.GEO_STROKE_COLOR,
@@ -338,15 +355,11 @@ def render_geometric(
     wave_amp = 1.8 * scale
     num_tails = lipid_type.num_tails
 
-    def _geo_kinks(i: int) -> list[float] | None:
-        if not show_kinks or not lipid_type.tail_kinks:
-            return None
-        if i < len(lipid_type.tail_kinks) and lipid_type.tail_kinks[i]:
-            return lipid_type.tail_kinks[i]
-        return None
+    tail_lengths = lipid_type.padded_tail_lengths
+    tail_kinks = lipid_type.padded_tail_kinks if show_kinks else _NO_KINKS
 
     if num_tails == 1:
-        d = _wavy_tail_d(0, 0, tail_len, wave_amp, segments=2, kinks=_geo_kinks(0))
+        d = _wavy_tail_d(0, 0, tail_len, wave_amp, segments=2, kinks=tail_kinks[0])
         elements.append(svg_path(
             d,
             fill="none",
@@ -359,8 +372,8 @@ def render_geometric(
         start_x = -gap * (num_tails - 1) / 2
         for i in range(num_tails):
             tx = start_x + i * gap
-            tl = lipid_type.tail_lengths[i] if i < len(lipid_type.tail_lengths) else 1.0
-            d = _wavy_tail_d(tx, 0, tail_len * tl, wave_amp * 0.8, segments=2, kinks=_geo_kinks(i))
+            tl = tail_lengths[i]
+            d = _wavy_tail_d(tx, 0, tail_len * tl, wave_amp * 0.8, segments=2, kinks=tail_kinks[i])
             elements.append(svg_path(
                 d,
                 fill="none",
@@ -11,35 +11,30 @@ from .svg_builder import _fmt, svg_group, svg_path
 def render_membrane_background(
     curve: ParametricCurve,
     config: MembraneConfig,
+    decorations: bool = True,
 ) -> str:
-    """Render the hydrophobic core as a filled region between leaflets."""
+    """Render the hydrophobic core as a filled region between leaflets.
+
+    With *decorations* off the dashed midline is left out.
+    """
     half = config.width / 2.0
     n_samples = 120
 
-    # Sample outer edge
-    outer_pts: list[tuple[float, float]] = []
-    inner_pts: list[tuple[float, float]] = []
-
-    for i in range(n_samples + 1):
-        t = i / n_samples
-        if curve.is_closed and i == n_samples:
-            t = 0.0  # Close the loop
-        cp = curve.sample(t)
-        outer_pts.append((cp.x + cp.normal_x * half, cp.y + cp.normal_y * half))
-        inner_pts.append((cp.x - cp.normal_x * half, cp.y - cp.normal_y * half))
+    # One cached centerline sampling serves both edges and the midline
+    grid = curve.sample_grid(n_samples)
+    xs, ys = grid.x, grid.y
+    nxs, nys = grid.normal_x, grid.normal_y
 
     # Build path: outer edge forward, inner edge backward
-    if not outer_pts:
-        return ""
-
-    d = f"M {_fmt(outer_pts[0][0])} {_fmt(outer_pts[0][1])}"
-    for px, py in outer_pts[1:]:
-        d += f" L {_fmt(px)} {_fmt(py)}"
-
-    # Reverse inner path
-    for px, py in reversed(inner_pts):
-        d += f" L {_fmt(px)} {_fmt(py)}"
-    d += " Z"
+    d_parts = [
+        f"{_fmt(x + nx * half)} {_fmt(y + ny * half)}"
+        for x, y, nx, ny in zip(xs, ys, nxs, nys)
+    ]
+    d_parts.extend(
+        f"{_fmt(x - nx * half)} {_fmt(y - ny * half)}"
+        for x, y, nx, ny in zip(reversed(xs), reversed(ys), reversed(nxs), reversed(nys))
+    )
+    d = "M " + " L ".join(d_parts) + " Z"
 
     bg = svg_path(
         d,
@@ -48,19 +43,11 @@ def render_membrane_background(
         stroke="none",
     )
 
-    # Membrane midline (dashed)
-    mid_d = f"M {_fmt(outer_pts[0][0] - (outer_pts[0][0] - inner_pts[0][0]) / 2)} {_fmt(outer_pts[0][1] - (outer_pts[0][1] - inner_pts[0][1]) / 2)}"
-    midline_pts: list[str] = []
-    for i in range(n_samples + 1):
-        t = i / n_samples
-        if curve.is_closed and i == n_samples:
-            t = 0.0
-        cp = curve.sample(t)
-        midline_pts.append(f"{_fmt(cp.x)} {_fmt(cp.y)}")
+    if not decorations:
+        return svg_group([bg], **{"class": "membrane-background"})
 
-    mid_d = f"M {midline_pts[0]}"
-    for pt in midline_pts[1:]:
-        mid_d += f" L {pt}"
+    # Membrane midline (dashed)
+    mid_d = "M " + " L ".join(f"{_fmt(x)} {_fmt(y)}" for x, y in zip(xs, ys))
 
     midline = svg_path(
         mid_d,
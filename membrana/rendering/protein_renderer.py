@@ -6,6 +6,10 @@ The caller wraps in a <g transform="..."> for positioning.
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from functools import lru_cache
+from operator import attrgetter
+
 from ..models.proteins import ProteinConfig, ProteinKind
 from . import styles
 from .svg_builder import (
@@ -20,28 +24,37 @@ from .svg_builder import (
 )
 
 
+# Every protein label shares these attributes
+_LABEL_ATTRS = (
+    f'font-size="9" text-anchor="middle" '
+    f'font-family="{styles.LABEL_FONT_FAMILY}" fill="#333"'
+)
+
+
+def _label(content: str, x: float, y: float) -> str:
+    return f'<text x="{_fmt(x)}" y="{_fmt(y)}" {_LABEL_ATTRS}>{content}</text>'
+
+
+# Everything the renderers read. position_t is applied by the caller's
+# transform, so dragging a protein along the membrane reuses its fragment
+_FRAGMENT_FIELDS = ("kind", "id", "label", "color", "width", "height", "num_passes", "leaflet")
+_fragment_key = attrgetter(*_FRAGMENT_FIELDS)
+
+
 def render_protein(
     protein: ProteinConfig,
     membrane_width: float,
 ) -> str:
     """Render a protein at origin. Membrane spans from -membrane_width/2 to +membrane_width/2."""
-    kind = protein.kind
-    if kind == ProteinKind.SINGLE_PASS_TM:
-        return _render_single_pass(protein, membrane_width)
-    elif kind == ProteinKind.MULTI_PASS_TM:
-        return _render_multi_pass(protein, membrane_width)
-    elif kind == ProteinKind.BETA_BARREL:
-        return _render_beta_barrel(protein, membrane_width)
-    elif kind == ProteinKind.PERIPHERAL:
-        return _render_peripheral(protein, membrane_width)
-    elif kind == ProteinKind.GPI_ANCHORED:
-        return _render_gpi_anchored(protein, membrane_width)
-    elif kind == ProteinKind.ION_CHANNEL:
-        return _render_ion_channel(protein, membrane_width)
-    elif kind == ProteinKind.ATP_SYNTHASE:
-        return _render_atp_synthase(protein, membrane_width)
-    else:
-        return _render_single_pass(protein, membrane_width)
+    return _render_protein_cached(_fragment_key(protein), membrane_width)
+
+
+@lru_cache(maxsize=128)
+def _render_protein_cached(fields: tuple, membrane_width: float) -> str:
+    # The fragment is a pure function of these fields and the membrane width
+    protein = ProteinConfig.model_construct(**dict(zip(_FRAGMENT_FIELDS, fields)))
+    render = _RENDERERS.get(protein.kind, _render_single_pass)
+    return render(protein, membrane_width)
 
 
 def _render_single_pass(p: ProteinConfig, mw: float) -> str:
@@ -61,9 +74,7 @@ def _render_single_pass(p: ProteinConfig, mw: float) -> str:
     elements.append(svg_ellipse(0, half + domain_r * 0.6, domain_r, domain_r * 0.6,
                                 fill=p.color, stroke="#333", stroke_width=0.6, fill_opacity=0.7))
     if p.label:
-        elements.append(svg_text(p.label, 0, -half - domain_r * 1.5,
-                                 font_size=9, text_anchor="middle",
-                                 font_family=styles.LABEL_FONT_FAMILY, fill="#333"))
+        elements.append(_label(p.label, 0, -half - domain_r * 1.5))
     return svg_group(elements, **{"class": f"protein protein-{p.id}"})
 
 
@@ -95,9 +106,7 @@ def _render_multi_pass(p: ProteinConfig, mw: float) -> str:
             elements.append(svg_path(d, fill="none", stroke=p.color, stroke_width=1.2))
 
     if p.label:
-        elements.append(svg_text(p.label, 0, -half - 15,
-                                 font_size=9, text_anchor="middle",
-                                 font_family=styles.LABEL_FONT_FAMILY, fill="#333"))
+        elements.append(_label(p.label, 0, -half - 15))
     return svg_group(elements, **{"class": f"protein protein-{p.id}"})
 
 
@@ -126,9 +135,7 @@ def _render_beta_barrel(p: ProteinConfig, mw: float) -> str:
                                 fill=styles.PORE_WATER_COLOR, stroke="#333",
                                 stroke_width=0.5))
     if p.label:
-        elements.append(svg_text(p.label, 0, -half - 10,
-                                 font_size=9, text_anchor="middle",
-                                 font_family=styles.LABEL_FONT_FAMILY, fill="#333"))
+        elements.append(_label(p.label, 0, -half - 10))
     return svg_group(elements, **{"class": f"protein protein-{p.id}"})
 
 
@@ -146,9 +153,7 @@ def _render_peripheral(p: ProteinConfig, mw: float) -> str:
                                 fill=p.color, stroke="#333", stroke_width=0.8))
     if p.label:
         label_y = cy - h - 5 if p.leaflet != "inner" else cy + h + 12
-        elements.append(svg_text(p.label, 0, label_y,
-                                 font_size=9, text_anchor="middle",
-                                 font_family=styles.LABEL_FONT_FAMILY, fill="#333"))
+        elements.append(_label(p.label, 0, label_y))
     return svg_group(elements, **{"class": f"protein protein-{p.id}"})
 
 
@@ -166,12 +171,16 @@ def _render_gpi_anchored(p: ProteinConfig, mw: float) -> str:
     elements.append(svg_ellipse(0, -half - blob_r * 3.5, blob_r, blob_r * 0.7,
                                 fill=p.color, stroke="#333", stroke_width=0.8))
     if p.label:
-        elements.append(svg_text(p.label, 0, -half - blob_r * 5,
-                                 font_size=9, text_anchor="middle",
-                                 font_family=styles.LABEL_FONT_FAMILY, fill="#333"))
+        elements.append(_label(p.label, 0, -half - blob_r * 5))
     return svg_group(elements, **{"class": f"protein protein-{p.id}"})
 
 
+_ION_CHANNEL_OUTLINE = (
+    "M {a} {b} C {a} {c}, {d} -2, {d} 0 C {d} 2, {a} {e}, {a} {f} "
+    "L {g} {f} C {g} {e}, {h} 2, {h} 0 C {h} -2, {g} {c}, {g} {b} Z"
+)
+
+
 def _render_ion_channel(p: ProteinConfig, mw: float) -> str:
     """Ion channel: hourglass shape."""
     elements: list[str] = []
@@ -179,23 +188,10 @@ def _render_ion_channel(p: ProteinConfig, mw: float) -> str:
     outer_w = p.width * 0.5
     inner_w = p.width * 0.12
 
-    # Hourglass outline
-    d = (
-        f"M {_fmt(-outer_w / 2)} {_fmt(-half)} "
-        f"C {_fmt(-outer_w / 2)} {_fmt(-half * 0.3)}, "
-        f"{_fmt(-inner_w / 2)} {_fmt(-2)}, "
-        f"{_fmt(-inner_w / 2)} {_fmt(0)} "
-        f"C {_fmt(-inner_w / 2)} {_fmt(2)}, "
-        f"{_fmt(-outer_w / 2)} {_fmt(half * 0.3)}, "
-        f"{_fmt(-outer_w / 2)} {_fmt(half)} "
-        f"L {_fmt(outer_w / 2)} {_fmt(half)} "
-        f"C {_fmt(outer_w / 2)} {_fmt(half * 0.3)}, "
-        f"{_fmt(inner_w / 2)} {_fmt(2)}, "
-        f"{_fmt(inner_w / 2)} {_fmt(0)} "
-        f"C {_fmt(inner_w / 2)} {_fmt(-2)}, "
-        f"{_fmt(outer_w / 2)} {_fmt(-half * 0.3)}, "
-        f"{_fmt(outer_w / 2)} {_fmt(-half)} "
-        f"Z"
+    # Hourglass outline: eight distinct coordinates, each formatted once
+    d = _ION_CHANNEL_OUTLINE.format(
+        a=_fmt(-outer_w / 2), b=_fmt(-half), c=_fmt(-half * 0.3), d=_fmt(-inner_w / 2),
+        e=_fmt(half * 0.3), f=_fmt(half), g=_fmt(outer_w / 2), h=_fmt(inner_w / 2),
     )
     elements.append(svg_path(d, fill=p.color, stroke="#333", stroke_width=0.8,
                              fill_opacity=0.75))
@@ -203,9 +199,7 @@ def _render_ion_channel(p: ProteinConfig, mw: float) -> str:
     elements.append(svg_ellipse(0, 0, inner_w * 0.8, 3,
                                 fill=styles.PORE_WATER_COLOR, stroke="none"))
     if p.label:
-        elements.append(svg_text(p.label, 0, -half - 10,
-                                 font_size=9, text_anchor="middle",
-                                 font_family=styles.LABEL_FONT_FAMILY, fill="#333"))
+        elements.append(_label(p.label, 0, -half - 10))
     return svg_group(elements, **{"class": f"protein protein-{p.id}"})
 
 
@@ -250,7 +244,17 @@ def _render_atp_synthase(p: ProteinConfig, mw: float) -> str:
                              font_weight="bold"))
 
     if p.label:
-        elements.append(svg_text(p.label, 0, f1_y - f1_r - 8,
-                                 font_size=9, text_anchor="middle",
-                                 font_family=styles.LABEL_FONT_FAMILY, fill="#333"))
+        elements.append(_label(p.label, 0, f1_y - f1_r - 8))
     return svg_group(elements, **{"class": f"protein protein-{p.id}"})
+
+
+# Dispatch table for render_protein, keyed by kind
+_RENDERERS: dict[ProteinKind, Callable[[ProteinConfig, float], str]] = {
+    ProteinKind.SINGLE_PASS_TM: _render_single_pass,
+    ProteinKind.MULTI_PASS_TM: _render_multi_pass,
+    ProteinKind.BETA_BARREL: _render_beta_barrel,
+    ProteinKind.PERIPHERAL: _render_peripheral,
+    ProteinKind.GPI_ANCHORED: _render_gpi_anchored,
+    ProteinKind.ION_CHANNEL: _render_ion_channel,
+    ProteinKind.ATP_SYNTHASE: _render_atp_synthase,
+}
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import math
-import re
+from functools import lru_cache
+from itertools import chain
 
 from ..geometry.curves import (
     CircularCurve,
@@ -15,8 +16,8 @@ from ..geometry.curves import (
 )
 from ..geometry.placement import LipidInstance, LipidPlacer
 from ..geometry.pore import compute_toroidal_pore_lipids
-from ..geometry.transforms import transform_str
-from ..models.lipids import LipidType
+from ..geometry.transforms import TRANSLATE_ROTATE, transform_str
+from ..models.lipids import DEFAULT_LIPID_INDEX, DEFAULT_LIPID_TYPES, LipidType
 from ..models.membrane import MembraneConfig, MembraneShape
 from ..models.scene import SceneConfig
 from .annotation_renderer import (
@@ -27,17 +28,63 @@ from .annotation_renderer import (
 from .lipid_renderer import render_lipid
 from .membrane_renderer import render_membrane_background
 from .protein_renderer import render_protein
-from .svg_builder import SVGBuilder, svg_circle, svg_line, svg_path, svg_rect, svg_group, svg_ellipse
+from .svg_builder import (
+    SVGBuilder,
+    _fmt,
+    svg_circle,
+    svg_ellipse,
+    svg_group,
+    svg_line,
+    svg_path,
+    svg_rect,
+)
+
+
+# Same constant math.degrees multiplies by; inlined in the per-instance loops
+_RAD2DEG = 180.0 / math.pi
+
+_ARROWHEAD_MARKER_DEF = (
+    '<marker id="arrowhead" markerWidth="8" markerHeight="6" '
+    'refX="8" refY="3" orient="auto" markerUnits="strokeWidth">'
+    '<polygon points="0 0, 8 3, 0 6" fill="#E74C3C"/>'
+    '</marker>'
+)
+
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
 
+def _circle_subpath(r: float) -> str:
+    """Relative path drawing a circle of radius *r* about the current point."""
+    rs = _fmt(r)
+    return (
+        f" m {_fmt(-r)} 0 a {rs} {rs} 0 1 0 {_fmt(2 * r)} 0"
+        f" a {rs} {rs} 0 1 0 {_fmt(-2 * r)} 0 z"
+    )
 
+
+def _any_overlap(xs: list[float], ys: list[float], radii: list[float], pad: float) -> bool:
+    """Whether any two circles, sorted by x and grown by *pad*, intersect."""
+    reach = 2 * max(radii) + pad
+    n = len(xs)
+    for i in range(n):
+        x, y, r = xs[i], ys[i], radii[i]
+        j = i + 1
+        while j < n and xs[j] - x < reach:
+            gap = r + radii[j] + pad
+            if (xs[j] - x) ** 2 + (ys[j] - y) ** 2 < gap * gap:
+                return True
+            j += 1
+    return False
+
+
+@lru_cache(maxsize=512)
 def _lighten_color(hex_color: str, factor: float) -> str:
     """Blend *hex_color* toward white by *factor* (0 = no change, 1 = white)."""
-    m = re.match(r"#?([0-9a-fA-F]{6})", hex_color)
-    if not m:
+    digits = hex_color[1:7] if hex_color.startswith("#") else hex_color[:6]
+    if len(digits) != 6 or not _HEX_DIGITS.issuperset(digits):
         return hex_color
-    r = int(m.group(1)[0:2], 16)
-    g = int(m.group(1)[2:4], 16)
-    b = int(m.group(1)[4:6], 16)
+    v = int(digits, 16)
+    r, g, b = v >> 16, (v >> 8) & 0xFF, v & 0xFF
     r = int(r + (255 - r) * factor)
     g = int(g + (255 - g) * factor)
     b = int(b + (255 - b) * factor)
@@ -47,16 +94,17 @@ def _lighten_color(hex_color: str, factor: float) -> str:
 class SceneRenderer:
     """Composes the complete SVG scene from a SceneConfig."""
 
-    def render(self, config: SceneConfig) -> str:
+    def render(self, config: SceneConfig, decorations: bool = True) -> str:
+        """Render *config* to an SVG document.
+
+        ``decorations=False`` skips purely cosmetic extras (membrane midline,
+        legend background box); bulk exports ask for it with
+        ``/api/export?decorations=false``.
+        """
         svg = SVGBuilder(config.canvas_width, config.canvas_height)
 
         # Arrow marker definition for flip-flop arrows
-        svg.add_def(
-            '<marker id="arrowhead" markerWidth="8" markerHeight="6" '
-            'refX="8" refY="3" orient="auto" markerUnits="strokeWidth">'
-            '<polygon points="0 0, 8 3, 0 6" fill="#E74C3C"/>'
-            '</marker>'
-        )
+        svg.add_def(_ARROWHEAD_MARKER_DEF)
 
         # Background
         if config.background_color:
@@ -65,8 +113,11 @@ class SceneRenderer:
                 fill=config.background_color,
             ))
 
-        # Build lipid type lookup
-        lipid_types = {lt.id: lt for lt in config.lipid_types}
+        # Build lipid type lookup (shared index for the built-in catalog)
+        if config.lipid_types is DEFAULT_LIPID_TYPES:
+            lipid_types = DEFAULT_LIPID_INDEX
+        else:
+            lipid_types = {lt.id: lt for lt in config.lipid_types}
 
         # Create parametric curve
         curve = self._create_curve(config)
@@ -84,9 +135,11 @@ class SceneRenderer:
         if config.pore_mode.enabled:
             arc_len = max(curve.arc_length(), 1)
             first_type = next(iter(config.composition.outer_leaflet.ratios.keys()), "PC")
+            pore_half = config.pore_mode.pore_radius / arc_len * 2
             for pl in config.pore_mode.placements:
                 pore_t = pl.position_t
-                pore_half = config.pore_mode.pore_radius / arc_len * 2
+                # One comprehension per pore beats a single pass testing every
+                # pore per lipid: each pass is cheap and the list shrinks
                 lipid_instances = [
                     li for li in lipid_instances
                     if abs(li.t - pore_t) > pore_half
@@ -111,7 +164,7 @@ class SceneRenderer:
         # ── Render layers ──
 
         # 1. Membrane background
-        svg.add(render_membrane_background(curve, config.membrane))
+        svg.add(render_membrane_background(curve, config.membrane, decorations))
 
         # 2. Pore water fill
         if config.pore_mode.enabled:
@@ -135,20 +188,38 @@ class SceneRenderer:
         if config.membrane.show_3d and config.membrane.shape == MembraneShape.LINEAR:
             self._render_3d_depth_rows(svg, config, lipid_instances, lipid_types, curve)
 
-        for inst in lipid_instances + pore_instances:
-            lt = lipid_types.get(inst.lipid_type_id)
-            if not lt:
-                continue
-            lipid_svg = render_lipid(lt, config.membrane.lipid_base_size, geo_mode, tail_hw, show_kinks, show_head_stroke)
-            angle_deg = math.degrees(inst.angle) - 90
-            t = transform_str(inst.x, inst.y, angle_deg, inst.scale)
-            svg.add(f'<g transform="{t}">{lipid_svg}</g>')
+        # A lipid's fragment depends only on its type and the membrane
+        # settings: draw each type once into <defs> and reference it per instance
+        base_size = config.membrane.lipid_base_size
+        # Per type: the <use> opening up to transform=", and a %-template with
+        # transform_str's translate+rotate fast path already spliced in
+        uses: dict[str, tuple[str, str]] = {}
+        add = svg.add
+        for inst in chain(lipid_instances, pore_instances):
+            use = uses.get(inst.lipid_type_id)
+            if use is None:
+                lt = lipid_types.get(inst.lipid_type_id)
+                if not lt:
+                    continue
+                ref = f"lipid-def-{len(uses)}"
+                lipid_svg = render_lipid(
+                    lt, base_size, geo_mode, tail_hw, show_kinks, show_head_stroke,
+                )
+                svg.add_def(f'<g id="{ref}">{lipid_svg}</g>')
+                open_tag = f'<use xlink:href="#{ref}" transform="'
+                use = uses[inst.lipid_type_id] = (open_tag, f'{open_tag}{TRANSLATE_ROTATE}"/>')
+            x, y, scale = inst.x, inst.y, inst.scale
+            angle_deg = inst.angle * _RAD2DEG - 90.0
+            if scale == 1.0 and angle_deg != 0.0 and (x != 0.0 or y != 0.0):
+                add(use[1] % (x, y, angle_deg))
+            else:
+                add(f'{use[0]}{transform_str(x, y, angle_deg, scale)}"/>')
 
         # 4. Proteins
         for prot in config.proteins:
             cp = curve.sample(prot.position_t)
             prot_svg = render_protein(prot, config.membrane.width)
-            angle_deg = math.degrees(cp.angle) + 90
+            angle_deg = cp.angle * _RAD2DEG + 90.0
             t = transform_str(cp.x, cp.y, angle_deg)
             svg.add(f'<g transform="{t}">{prot_svg}</g>')
 
@@ -168,7 +239,7 @@ class SceneRenderer:
         if config.show_legend:
             legend_svg = render_legend(
                 lipid_types, config.composition,
-                config.canvas_width - 150, 10,
+                config.canvas_width - 150, 10, decorations,
             )
             if legend_svg:
                 svg.add(legend_svg)
@@ -224,14 +295,17 @@ class SceneRenderer:
     ) -> list[LipidInstance]:
         """Apply raft mode: thicken lipids in raft regions."""
         raft = config.raft_mode
-        result: list[LipidInstance] = []
+        # Plain (start, end) pairs: the inner loop runs once per lipid
+        spans = [(pl.start_t, pl.end_t) for pl in raft.placements]
+        factor = raft.thickness_factor
+        # Instances are fresh per render, so scale them in place
         for inst in instances:
-            for pl in raft.placements:
-                if pl.start_t <= inst.t <= pl.end_t:
-                    inst.scale *= raft.thickness_factor
+            t = inst.t
+            for start_t, end_t in spans:
+                if start_t <= t <= end_t:
+                    inst.scale *= factor
                     break
-            result.append(inst)
-        return result
+        return instances
 
     def _render_scissors(
         self,
@@ -297,7 +371,7 @@ class SceneRenderer:
 
         # Sort outer lipids by X to get the ordered front row
         outer_lipids = sorted(
-            [li for li in lipid_instances if li.leaflet == "outer"],
+            (li for li in lipid_instances if li.leaflet == "outer"),
             key=lambda li: li.x,
         )
         n = len(outer_lipids)
@@ -312,35 +386,72 @@ class SceneRenderer:
         # row_spacing slider scales this: default 6 → factor 1.0
         y_per_row = half_spacing * 0.5 * (row_sp / 6.0)
 
+        # Resolve each front-row lipid once into parallel columns; the row
+        # loop below then only applies per-row offsets. Unknown types keep
+        # their slot (None) so dropping k lipids from the right stays exact.
+        xs = [li.x for li in outer_lipids]
+        head_ys = [li.y - base_head_r for li in outer_lipids]
+        front_types: list[LipidType | None] = [
+            lipid_types.get(li.lipid_type_id) for li in outer_lipids
+        ]
+        head_arcs = {
+            lt.id: _circle_subpath(base_head_r * lt.head_radius_factor)
+            for lt in front_types if lt
+        }
+        head_colors = {lt.id: lt.head_color for lt in front_types if lt}
+        head_rs = [
+            base_head_r * lt.head_radius_factor if lt else 0.0 for lt in front_types
+        ]
+        stroke_w = 0.6 if show_head_stroke else 0.0
+
+        # One <path> per fill colour reorders heads across colours and draws
+        # every fill before every stroke, so it is exact only when no two
+        # heads of a row touch. Rows differ from the front row by an offset
+        # and dropped heads, so one check covers them all; crowded rows
+        # (negative lipid spacing) keep one circle per head in x order.
+        batched = not _any_overlap(xs, head_ys, head_rs, stroke_w)
+
         # Render from furthest back (lightest) to just behind front (darkest)
         for k in range(depth_rows - 1, 0, -1):
             lighten_factor = k * lighten_per_row
-            # Drop the last k lipids from the sorted list
-            row_lipids = outer_lipids[: n - k]
+            # Only a handful of distinct head colours per row: blend each once
+            fills = {
+                tid: _lighten_color(color, lighten_factor)
+                for tid, color in head_colors.items()
+            }
+            # Shift right by half_spacing × k, up from head position by y_per_row × k
+            dx = half_spacing * k
+            dy = y_per_row * k
+
+            if show_head_stroke:
+                stroke_color = _lighten_color("#333333", lighten_factor)
+            else:
+                stroke_color = "none"
 
-            for inst in row_lipids:
-                lt = lipid_types.get(inst.lipid_type_id)
+            row_paths: dict[str, list[str]] = {}
+            # Drop the last k lipids from the sorted front row
+            for i in range(n - k):
+                lt = front_types[i]
                 if not lt:
                     continue
 
-                head_r = base_head_r * lt.head_radius_factor
-
-                # Shift right by half_spacing × k, up from head position by y_per_row × k
-                hx = inst.x + half_spacing * k
-                hy = inst.y - base_head_r - y_per_row * k
-
-                head_color = _lighten_color(lt.head_color, lighten_factor)
+                hx = xs[i] + dx
+                hy = head_ys[i] - dy
 
-                if show_head_stroke:
-                    stroke_color = _lighten_color("#333333", lighten_factor)
-                    stroke_w = 0.6
-                else:
-                    stroke_color = "none"
-                    stroke_w = 0
-
-                svg.add(svg_circle(
-                    hx, hy, head_r,
-                    fill=head_color,
-                    stroke=stroke_color,
-                    stroke_width=stroke_w,
+                fill = fills[lt.id]
+                if not batched:
+                    svg.add(svg_circle(
+                        hx, hy, head_rs[i],
+                        fill=fill, stroke=stroke_color, stroke_width=stroke_w,
+                    ))
+                    continue
+                subpaths = row_paths.get(fill)
+                if subpaths is None:
+                    subpaths = row_paths[fill] = []
+                subpaths.append(f"M {_fmt(hx)} {_fmt(hy)}{head_arcs[lt.id]}")
+
+            for fill, subpaths in row_paths.items():
+                svg.add(svg_path(
+                    " ".join(subpaths),
+                    fill=fill, stroke=stroke_color, stroke_width=stroke_w,
                 ))
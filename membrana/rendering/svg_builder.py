@@ -2,23 +2,40 @@
 
 from __future__ import annotations
 
+import math
+from functools import lru_cache
 from typing import Optional
 
 
 def _fmt(v: float) -> str:
     """Format float for SVG (trim trailing zeros)."""
+    if not v:
+        # 0.0 and -0.0 share a cache key but format differently
+        return "-0" if math.copysign(1.0, v) < 0 else "0"
+    return _fmt_nonzero(v)
+
+
+@lru_cache(maxsize=4096)
+def _fmt_nonzero(v: float) -> str:
+    # Heads, tails and icons repeat the same handful of coordinates
     s = f"{v:.2f}"
     if "." in s:
         s = s.rstrip("0").rstrip(".")
     return s
 
 
+# Python keyword -> SVG attribute name, filled on first use of each keyword
+_SVG_KEYS: dict[str, str] = {}
+
+
 def _attrs(**kwargs: object) -> str:
     parts: list[str] = []
     for k, v in kwargs.items():
         if v is None:
             continue
-        svg_key = k.replace("_", "-")
+        svg_key = _SVG_KEYS.get(k)
+        if svg_key is None:
+            svg_key = _SVG_KEYS[k] = k.replace("_", "-")
         if isinstance(v, float):
             parts.append(f'{svg_key}="{_fmt(v)}"')
         else:
@@ -48,19 +65,21 @@ class SVGBuilder:
         self._elements.append(svg_fragment)
 
     def render(self) -> str:
-        defs_block = ""
-        if self._defs:
-            defs_inner = "\n".join(self._defs)
-            defs_block = f"<defs>\n{defs_inner}\n</defs>\n"
-        body = "\n".join(self._elements)
-        return (
+        # One join over the whole document; the body is never copied into
+        # an intermediate string
+        parts = [
             f'<svg xmlns="http://www.w3.org/2000/svg" '
+            f'xmlns:xlink="http://www.w3.org/1999/xlink" '
             f'width="{_fmt(self.width)}" height="{_fmt(self.height)}" '
-            f'viewBox="{self.viewbox}">\n'
-            f"{defs_block}"
-            f"{body}\n"
-            f"</svg>"
-        )
+            f'viewBox="{self.viewbox}">'
+        ]
+        if self._defs:
+            parts.append("<defs>")
+            parts.extend(self._defs)
+            parts.append("</defs>")
+        parts.extend(self._elements or ("",))
+        parts.append("</svg>")
+        return "\n".join(parts)
 
 
 # ── Element helpers ──────────────────────────────────────────────────────
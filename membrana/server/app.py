@@ -5,16 +5,20 @@ from __future__ import annotations
 from pathlib import Path
 
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 
-from .routes import router
+from .routes import SCENE_CONFIG_SCHEMAS, router
 from .websocket import ws_router
 
 
 def create_app() -> FastAPI:
     app = FastAPI(title="Membrana", version="0.2.0")
 
+    # SVG markup compresses very well; small JSON replies go out as-is
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+
     # Static files
     static_dir = Path(__file__).resolve().parent.parent / "static"
     app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
@@ -25,6 +29,19 @@ def create_app() -> FastAPI:
     # WebSocket routes
     app.include_router(ws_router)
 
+    # Routes that parse SceneConfig bodies themselves reference its schema
+    # by name; register it with the generated components
+    default_openapi = app.openapi
+
+    def openapi() -> dict:
+        if app.openapi_schema is None:
+            schema = default_openapi()
+            schemas = schema.setdefault("components", {}).setdefault("schemas", {})
+            schemas.update(SCENE_CONFIG_SCHEMAS)
+        return app.openapi_schema
+
+    app.openapi = openapi
+
     @app.get("/", response_class=HTMLResponse)
     async def index():
         index_path = static_dir / "index.html"
@@ -2,24 +2,80 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter
+from functools import lru_cache
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.responses import Response
+from pydantic import ValidationError
 
-from ..models.lipids import DEFAULT_LIPID_TYPES
-from ..models.scene import SceneConfig
+from ..geometry.curves import ParametricCurve
+from ..models.scene import SceneConfig, default_lipid_types_json
 from ..presets.registry import PresetRegistry
-from ..rendering.scene_renderer import SceneRenderer
+from .render_cache import cached_svg, renderer
 
 router = APIRouter()
-_renderer = SceneRenderer()
 _presets = PresetRegistry()
 
 
-@router.post("/render")
-async def render_svg(config: SceneConfig):
-    """Render SVG from configuration."""
-    svg_str = _renderer.render(config)
-    return {"svg": svg_str}
+@lru_cache(maxsize=64)
+def _parse_config(body: bytes) -> SceneConfig:
+    # The frontend re-posts the same scene while the user scrubs; identical
+    # bodies skip validation. SceneConfig is frozen, so sharing it is safe.
+    return SceneConfig.model_validate_json(body)
+
+
+def _is_json(content_type: str | None) -> bool:
+    # Same test FastAPI applies before parsing a declared JSON body
+    if not content_type:
+        return False
+    media = content_type.split(";", 1)[0].strip().lower()
+    main, _, sub = media.partition("/")
+    return main == "application" and (sub == "json" or sub.endswith("+json"))
+
+
+async def _scene_config(request: Request) -> SceneConfig:
+    """Request-body dependency: validate the raw JSON in pydantic-core."""
+    body = await request.body()
+    if not _is_json(request.headers.get("content-type")):
+        raise RequestValidationError([{
+            "type": "model_attributes_type",
+            "loc": ("body",),
+            "msg": "Input should be a valid dictionary or object to extract fields from",
+            "input": body.decode(errors="replace"),
+        }])
+    try:
+        return _parse_config(body)
+    except ValidationError as e:
+        # Same shape as FastAPI's own body errors, so clients see no change
+        errors = [
+            {**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)
+        ]
+        raise RequestValidationError(errors) from e
+
+
+# The endpoints read the body themselves, so FastAPI cannot infer its schema;
+# describe it explicitly. The nested models go into components (see app.py).
+_SCENE_SCHEMA = SceneConfig.model_json_schema(ref_template="#/components/schemas/{model}")
+SCENE_CONFIG_SCHEMAS: dict[str, dict] = {
+    **_SCENE_SCHEMA.pop("$defs", {}),
+    "SceneConfig": _SCENE_SCHEMA,
+}
+_SCENE_CONFIG_BODY = {
+    "requestBody": {
+        "content": {
+            "application/json": {"schema": {"$ref": "#/components/schemas/SceneConfig"}},
+        },
+        "required": True,
+    },
+}
+
+
+@router.post("/render", openapi_extra=_SCENE_CONFIG_BODY)
+async def render_svg(config: SceneConfig = Depends(_scene_config)):
+    """Render SVG from configuration, returned as the raw document."""
+    # No JSON envelope: escaping the whole document cost more than a cached render
+    return Response(content=await cached_svg(config), media_type="image/svg+xml")
 
 
 @router.get("/presets")
@@ -39,13 +95,17 @@ async def get_preset(preset_id: str):
 @router.get("/lipid-types")
 async def list_lipid_types():
     """Return default lipid type library."""
-    return {"lipid_types": [lt.model_dump() for lt in DEFAULT_LIPID_TYPES]}
+    return {"lipid_types": default_lipid_types_json()}
+
 
+@router.post("/export", openapi_extra=_SCENE_CONFIG_BODY)
+async def export_svg(config: SceneConfig = Depends(_scene_config), decorations: bool = True):
+    """Export SVG as downloadable file.
 
-@router.post("/export")
-async def export_svg(config: SceneConfig):
-    """Export SVG as downloadable file."""
-    svg_str = _renderer.render(config)
+    Bulk exports can pass ``decorations=false`` to leave out the dashed
+    midline and the legend background box.
+    """
+    svg_str = await cached_svg(config, decorations)
     return Response(
         content=svg_str,
         media_type="image/svg+xml",
@@ -53,8 +113,8 @@ async def export_svg(config: SceneConfig):
     )
 
 
-@router.post("/sample-curve")
-async def sample_curve(config: SceneConfig, num_points: int = 20):
+@router.post("/sample-curve", openapi_extra=_SCENE_CONFIG_BODY)
+async def sample_curve(config: SceneConfig = Depends(_scene_config), num_points: int = 20):
     """Sample the current parametric curve at N evenly-spaced points.
 
     Used by the frontend to convert any shape to a Bezier spline.
@@ -62,18 +122,30 @@ async def sample_curve(config: SceneConfig, num_points: int = 20):
     end so the Catmull-Rom spline closes the loop.
     """
     num_points = max(3, min(num_points, 100))
-    curve = _renderer._create_curve(config)
-    points: list[list[float]] = []
+    curve = _curve_for(config)
     if curve.is_closed:
-        # Sample N points around the closed shape, then repeat first to close
-        for i in range(num_points):
-            t = i / num_points  # don't reach t=1.0 (same as t=0)
-            x, y = curve.point(t)
-            points.append([round(x, 1), round(y, 1)])
-        points.append(list(points[0]))  # close the loop
+        # t = i/N for i < N, then back to t = 0 (same as t = 1) to close the loop
+        grid = curve.sample_grid(num_points)
     else:
-        for i in range(num_points):
-            t = i / (num_points - 1)
-            x, y = curve.point(t)
-            points.append([round(x, 1), round(y, 1)])
+        grid = curve.sample_grid(num_points - 1)
+    points = [[round(x, 1), round(y, 1)] for x, y in zip(grid.x, grid.y)]
     return {"points": points}
+
+
+_CURVE_CACHE_SIZE = 64
+_curves: dict[tuple[str, float, float], ParametricCurve] = {}
+
+
+def _curve_for(config: SceneConfig) -> ParametricCurve:
+    """Build the membrane curve, reusing it while the UI scrubs one shape.
+
+    The curve depends only on the membrane settings and the canvas size. Its
+    own sample caches come along with it.
+    """
+    key = (config.membrane.model_dump_json(), config.canvas_width, config.canvas_height)
+    curve = _curves.get(key)
+    if curve is None:
+        if len(_curves) >= _CURVE_CACHE_SIZE:
+            del _curves[next(iter(_curves))]
+        curve = _curves[key] = renderer._create_curve(config)
+    return curve
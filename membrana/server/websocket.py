@@ -1,27 +1,213 @@
-"""WebSocket endpoint for live preview."""
+"""WebSocket endpoint for live preview.
+
+Protocol: the client opens with ``{"op": "set", "seq": n, "config": {...}}``
+carrying the full SceneConfig, then sends only what changed as
+``{"op": "patch", "seq": n, "ops": [...]}``, a JSON Patch (RFC 6902;
+``add``, ``remove`` and ``replace``) against the last state it sent.
+Every reply is one binary frame, ``[4-byte LE header length][JSON header]
+[payload]``. The header echoes ``seq`` and carries ``status``:
+
+- ``"rendering"``: the config is being rendered (not sent for cache hits)
+- ``"ok"``: the payload is the SVG document, gzipped when ``enc`` is ``"gzip"``
+- ``"error"``: ``message`` says why; there is no payload. With ``resync``
+  set the server has dropped its copy of the state and the next message
+  must be a ``set``
+"""
 
 from __future__ import annotations
 
+import asyncio
+import json
+
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
 from ..models.scene import SceneConfig
-from ..rendering.scene_renderer import SceneRenderer
+from .render_cache import cached_svg_gzip
 
 ws_router = APIRouter()
-_renderer = SceneRenderer()
+
+
+class PatchError(ValueError):
+    """A patch op that does not apply to the current state."""
+
+
+def _pointer(path: str) -> list[str]:
+    if not path.startswith("/"):
+        raise PatchError(f"invalid JSON pointer: {path!r}")
+    return [p.replace("~1", "/").replace("~0", "~") for p in path[1:].split("/")]
+
+
+def _index(container: list, token: str, insert: bool = False) -> int:
+    if insert and token == "-":
+        return len(container)
+    if not token.isdigit() or (len(token) > 1 and token[0] == "0"):
+        raise PatchError(f"invalid array index: {token!r}")
+    i = int(token)
+    if i > len(container) or (i == len(container) and not insert):
+        raise PatchError(f"array index out of range: {i}")
+    return i
+
+
+def _apply_op(doc, tokens: list[str], op: str, value=None):
+    """Return *doc* with one op applied at *tokens*, copying only the path.
+
+    Untouched branches are shared with the previous state rather than
+    deep-copied, so a patch costs O(depth) regardless of the config size.
+    """
+    if not tokens:
+        if op == "remove":
+            raise PatchError("cannot remove the whole document")
+        return value
+    token, rest = tokens[0], tokens[1:]
+    if isinstance(doc, dict):
+        doc = dict(doc)
+        if rest:
+            if token not in doc:
+                raise PatchError(f"path not found: {token!r}")
+            doc[token] = _apply_op(doc[token], rest, op, value)
+        elif op == "add":
+            doc[token] = value
+        elif token not in doc:
+            raise PatchError(f"path not found: {token!r}")
+        elif op == "replace":
+            doc[token] = value
+        else:
+            del doc[token]
+        return doc
+    if isinstance(doc, list):
+        doc = list(doc)
+        if rest:
+            i = _index(doc, token)
+            doc[i] = _apply_op(doc[i], rest, op, value)
+        elif op == "add":
+            doc.insert(_index(doc, token, insert=True), value)
+        elif op == "replace":
+            doc[_index(doc, token)] = value
+        else:
+            del doc[_index(doc, token)]
+        return doc
+    raise PatchError(f"cannot descend into {type(doc).__name__} at {token!r}")
+
+
+def _apply_patch(doc: dict, ops: list) -> dict:
+    """Apply a JSON Patch to *doc* without mutating it."""
+    if not isinstance(ops, list):
+        raise PatchError("ops must be a list")
+    for entry in ops:
+        try:
+            op = entry["op"]
+            path = entry["path"]
+        except (KeyError, TypeError):
+            raise PatchError(f"malformed patch op: {entry!r}") from None
+        if op not in ("add", "remove", "replace"):
+            raise PatchError(f"unsupported patch op: {op!r}")
+        if op != "remove" and "value" not in entry:
+            raise PatchError(f"{op} needs a value: {path!r}")
+        doc = _apply_op(doc, _pointer(path), op, entry.get("value"))
+    return doc
+
+
+def _frame(header: dict, payload: bytes = b"") -> bytes:
+    """Binary reply: [4-byte LE header length][JSON header][payload].
+
+    The SVG travels as bytes after the header instead of as an escaped JSON
+    string; ``svg_len`` gives the payload size in bytes.
+    """
+    head = json.dumps({**header, "svg_len": len(payload)}, separators=(",", ":")).encode()
+    return len(head).to_bytes(4, "little") + head + payload
+
+
+def _fold(latest: dict | None, raw: str | bytes) -> tuple[dict | None, int | None, str | None]:
+    """Apply one client message to *latest*: ``(state, seq, error)``.
+
+    On error the state is None: the client's copy and ours have diverged,
+    and later patches are meaningless until it sends a full ``set``.
+    """
+    try:
+        msg = json.loads(raw)
+    except Exception as e:
+        # RecursionError from absurd nesting included: whatever a client
+        # sends ends up as an error reply rather than a dead reader
+        return None, None, f"invalid JSON: {e}"
+    if not isinstance(msg, dict):
+        return None, None, "message must be a JSON object"
+    seq = msg.get("seq")
+    op = msg.get("op", "set")
+    try:
+        if op == "set":
+            state = msg.get("config")
+            if not isinstance(state, dict):
+                raise PatchError("set needs a config object")
+        elif op == "patch":
+            if latest is None:
+                raise PatchError("patch received before set")
+            state = _apply_patch(latest, msg.get("ops"))
+        else:
+            raise PatchError(f"unknown op: {op!r}")
+    except Exception as e:
+        return None, seq, str(e) or type(e).__name__
+    return state, seq, None
+
+
+async def _read_frames(websocket: WebSocket, latest: asyncio.Queue) -> None:
+    """Fold each frame into the client's state as it arrives.
+
+    Patches are applied here, in order, so only the newest resulting
+    ``(state, seq, error)`` needs to wait in the one-slot *latest* queue: a
+    frame arriving while one is still waiting replaces it, and a client
+    flooding edits of either kind costs O(1) memory. None marks the end of
+    the connection, however the reader stops.
+    """
+    state: dict | None = None
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+            raw = message.get("text")
+            if raw is None:
+                raw = message.get("bytes") or b""
+            state, seq, error = _fold(state, raw)
+            if latest.full():
+                latest.get_nowait()
+            latest.put_nowait((state, seq, error))
+    finally:
+        if latest.full():
+            latest.get_nowait()
+        latest.put_nowait(None)
 
 
 @ws_router.websocket("/ws/preview")
 async def preview_ws(websocket: WebSocket):
     await websocket.accept()
+    latest: asyncio.Queue[tuple | None] = asyncio.Queue(maxsize=1)
+    reader = asyncio.create_task(_read_frames(websocket, latest))
     try:
         while True:
-            data = await websocket.receive_json()
+            # Edits superseded while a render was in flight were already
+            # folded into the newest state by the reader
+            item = await latest.get()
+            if item is None:
+                break
+            state, seq, error = item
             try:
-                config = SceneConfig(**data)
-                svg_str = _renderer.render(config)
-                await websocket.send_json({"status": "ok", "svg": svg_str})
+                if error is not None:
+                    header = {"status": "error", "seq": seq, "message": error, "resync": True}
+                    await websocket.send_bytes(_frame(header))
+                    continue
+                config = SceneConfig.model_validate(state)
+                payload = await cached_svg_gzip(
+                    config,
+                    # Misses tell the client a render is under way
+                    lambda: websocket.send_bytes(_frame({"status": "rendering", "seq": seq})),
+                )
+                header = {"status": "ok", "seq": seq, "enc": "gzip"}
+                await websocket.send_bytes(_frame(header, payload))
             except Exception as e:
-                await websocket.send_json({"status": "error", "message": str(e)})
+                await websocket.send_bytes(
+                    _frame({"status": "error", "seq": seq, "message": str(e)})
+                )
     except WebSocketDisconnect:
         pass
+    finally:
+        reader.cancel()
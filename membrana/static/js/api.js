@@ -7,12 +7,32 @@ let wsReady = false;
 let onSvgUpdate = null;
 let onStatusChange = null;
 
+const _utf8 = new TextDecoder();
+
+/**
+ * Split a preview reply: [4-byte LE header length][JSON header][payload].
+ */
+function parseFrame(buf) {
+    const headLen = new DataView(buf).getUint32(0, true);
+    const header = JSON.parse(_utf8.decode(new Uint8Array(buf, 4, headLen)));
+    const payload = new Uint8Array(buf, 4 + headLen, header.svg_len);
+    return { header, payload };
+}
+
+async function gunzipText(bytes) {
+    const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+    return await new Response(stream).text();
+}
+
 function connectWebSocket() {
     const proto = location.protocol === 'https:' ? 'wss:' : 'ws:';
     ws = new WebSocket(`${proto}//${location.host}/ws/preview`);
+    ws.binaryType = 'arraybuffer';
 
     ws.onopen = () => {
         wsReady = true;
+        // A new connection starts with no server-side state
+        _sentState = null;
         if (onStatusChange) onStatusChange('connected');
     };
 
@@ -28,11 +48,20 @@ function connectWebSocket() {
         if (onStatusChange) onStatusChange('error');
     };
 
-    ws.onmessage = (event) => {
-        const data = JSON.parse(event.data);
+    ws.onmessage = async (event) => {
+        const { header: data, payload } = parseFrame(event.data);
         if (data.status === 'ok' && onSvgUpdate) {
-            onSvgUpdate(data.svg);
+            const svg = data.enc === 'gzip' ? await gunzipText(payload) : _utf8.decode(payload);
+            // Decompression is async: never let an older frame overwrite a newer one
+            if (data.seq < _shownSeq) return;
+            _shownSeq = data.seq;
+            onSvgUpdate(svg);
+        } else if (data.status === 'rendering') {
+            // Only worth showing while the newest request is the one in flight
+            if (data.seq === _seq && onStatusChange) onStatusChange('rendering');
         } else if (data.status === 'error') {
+            // The server dropped its copy of the state: next send is a full set
+            if (data.resync) _sentState = null;
             console.error('Render error:', data.message);
             if (onStatusChange) onStatusChange('error');
         }
@@ -40,12 +69,53 @@ function connectWebSocket() {
 }
 
 let _debounceTimer = null;
+let _seq = 0;
+let _shownSeq = 0;
+// Last state sent on this connection; patches are diffed against it
+let _sentState = null;
+
+function _pointerToken(key) {
+    return String(key).replace(/~/g, '~0').replace(/\//g, '~1');
+}
+
+// JSON Patch ops turning `prev` into `next`. Objects are diffed key by key;
+// arrays and scalars that changed are replaced whole. Undefined values count
+// as missing, as they do for JSON.stringify.
+function diffState(prev, next, path = '', ops = []) {
+    for (const key of Object.keys(next)) {
+        const p = `${path}/${_pointerToken(key)}`;
+        const a = prev[key];
+        const b = next[key];
+        if (b === undefined) continue;
+        if (a === undefined) {
+            ops.push({ op: 'add', path: p, value: b });
+        } else if (a && b && typeof a === 'object' && typeof b === 'object'
+                   && !Array.isArray(a) && !Array.isArray(b)) {
+            diffState(a, b, p, ops);
+        } else if (a !== b && JSON.stringify(a) !== JSON.stringify(b)) {
+            ops.push({ op: 'replace', path: p, value: b });
+        }
+    }
+    for (const key of Object.keys(prev)) {
+        if (prev[key] !== undefined && next[key] === undefined) {
+            ops.push({ op: 'remove', path: `${path}/${_pointerToken(key)}` });
+        }
+    }
+    return ops;
+}
 
 function requestRender(state) {
     clearTimeout(_debounceTimer);
     _debounceTimer = setTimeout(() => {
         if (ws && wsReady) {
-            ws.send(JSON.stringify(state));
+            if (_sentState === null) {
+                ws.send(JSON.stringify({ op: 'set', seq: ++_seq, config: state }));
+            } else {
+                const ops = diffState(_sentState, state);
+                if (!ops.length) return;
+                ws.send(JSON.stringify({ op: 'patch', seq: ++_seq, ops }));
+            }
+            _sentState = structuredClone(state);
         } else {
             // Fallback to REST
             fetch('/api/render', {
@@ -53,9 +123,12 @@ function requestRender(state) {
                 headers: { 'Content-Type': 'application/json' },
                 body: JSON.stringify(state),
             })
-            .then(r => r.json())
-            .then(data => {
-                if (data.svg && onSvgUpdate) onSvgUpdate(data.svg);
+            .then(r => {
+                if (!r.ok) throw new Error(`HTTP ${r.status}`);
+                return r.text();
+            })
+            .then(svg => {
+                if (svg && onSvgUpdate) onSvgUpdate(svg);
             })
             .catch(err => console.error('Render error:', err));
         }
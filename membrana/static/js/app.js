@@ -121,6 +121,9 @@ async function init() {
         if (s === 'connected') {
             status.textContent = 'Live';
             status.className = 'status connected';
+        } else if (s === 'rendering') {
+            status.textContent = 'Rendering...';
+            status.className = 'status connected';
         } else if (s === 'error') {
             status.textContent = 'Error';
             status.className = 'status error';
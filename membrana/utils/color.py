@@ -2,20 +2,28 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 
+# Two-digit hex for every channel value; skips format-spec parsing
+_HEX2 = tuple(f"{i:02x}" for i in range(256))
+
+
+@lru_cache(maxsize=512)
 def hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
-    hex_color = hex_color.lstrip("#")
-    return (
-        int(hex_color[0:2], 16),
-        int(hex_color[2:4], 16),
-        int(hex_color[4:6], 16),
-    )
+    # Palettes are small: parse each colour once, all three channels in C
+    rgb = bytes.fromhex(hex_color.lstrip("#")[:6])
+    if len(rgb) != 3:
+        raise ValueError(f"invalid hex colour: {hex_color!r}")
+    return rgb[0], rgb[1], rgb[2]
 
 
 def rgb_to_hex(r: int, g: int, b: int) -> str:
+    if 0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255:
+        return f"#{_HEX2[r]}{_HEX2[g]}{_HEX2[b]}"
     return f"#{r:02x}{g:02x}{b:02x}"
 
 
+@lru_cache(maxsize=512)
 def lighten(hex_color: str, factor: float = 0.3) -> str:
     r, g, b = hex_to_rgb(hex_color)
     r = min(255, int(r + (255 - r) * factor))
@@ -24,6 +32,7 @@ def lighten(hex_color: str, factor: float = 0.3) -> str:
     return rgb_to_hex(r, g, b)
 
 
+@lru_cache(maxsize=512)
 def darken(hex_color: str, factor: float = 0.3) -> str:
     r, g, b = hex_to_rgb(hex_color)
     r = max(0, int(r * (1 - factor)))
@@ -32,6 +41,7 @@ def darken(hex_color: str, factor: float = 0.3) -> str:
     return rgb_to_hex(r, g, b)
 
 
+@lru_cache(maxsize=1024)
 def with_alpha(hex_color: str, alpha: float) -> str:
     """Return rgba() CSS string."""
     r, g, b = hex_to_rgb(hex_color)
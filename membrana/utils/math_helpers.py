@@ -18,11 +18,14 @@ def smoothstep(edge0: float, edge1: float, x: float) -> float:
 
 def normalize_angle(angle: float) -> float:
     """Normalize angle to [-pi, pi]."""
-    while angle > math.pi:
-        angle -= 2 * math.pi
-    while angle < -math.pi:
-        angle += 2 * math.pi
-    return angle
+    # IEEE remainder: constant time and exact, where repeated 2*pi steps
+    # loop in proportion to the input and accumulate rounding error
+    r = math.remainder(angle, math.tau)
+    # Ties round to an even quotient (3*pi -> -pi); keep the old results,
+    # where odd multiples of pi land on the end of the input's sign
+    if abs(r) == math.pi:
+        return math.copysign(math.pi, angle)
+    return r
 
 
 def vec2_length(x: float, y: float) -> float: